@@ -1,6 +1,7 @@
 # src/classes/app_controller.py
 
 import asyncio
+import concurrent.futures
 import logging
 import time
 import numpy as np
@@ -10,22 +11,21 @@ from classes.parameters import Parameters
 from classes.follower import Follower
 from classes.setpoint_sender import SetpointSender
 from classes.video_handler import VideoHandler
-from classes.trackers.csrt_tracker import CSRTTracker  # Import other trackers as necessary
 from classes.segmentor import Segmentor
 from classes.trackers.tracker_factory import create_tracker
 from classes.px4_interface_manager import PX4InterfaceManager  # Updated import path
 from classes.telemetry_handler import TelemetryHandler
 from classes.fastapi_handler import FastAPIHandler  # Correct import
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from classes.osd_handler import OSDHandler
-from classes.gstreamer_handler import GStreamerHandler
 from classes.mavlink_data_manager import MavlinkDataManager
-from classes.frame_preprocessor import FramePreprocessor
 from classes.estimators.estimator_factory import create_estimator
 from classes.detectors.detector_factory import create_detector
 
-# Import the SmartTracker module
-from classes.smart_tracker import SmartTracker
+# Optional components (GStreamer output, preprocessing, YOLO smart tracking) are imported
+# only when enabled, so deployments that do not use them never load their dependencies
+if TYPE_CHECKING:
+    from classes.smart_tracker import SmartTracker
 
 
 class AppController:
@@ -36,17 +36,23 @@ class AppController:
         """
         logging.debug("Initializing AppController...")
 
+        # Shared bounded pool for blocking work, sized for its users: the three MAVLink fetches
+        # PX4InterfaceManager gathers at once, plus one JPEG encode each for the HTTP and WebSocket streams
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=5, thread_name_prefix="pixeagle")
+
         # Initialize MAVLink Data Manager
         self.mavlink_data_manager = MavlinkDataManager(
             mavlink_host=Parameters.MAVLINK_HOST,
             mavlink_port=Parameters.MAVLINK_PORT,
             polling_interval=Parameters.MAVLINK_POLLING_INTERVAL,
             data_points=Parameters.MAVLINK_DATA_POINTS,
-            enabled=Parameters.MAVLINK_ENABLED
+            enabled=Parameters.MAVLINK_ENABLED,
+            executor=self.executor
         )
         
         # Initialize frame preprocessor if enabled
         if Parameters.ENABLE_PREPROCESSING:
+            from classes.frame_preprocessor import FramePreprocessor
             self.preprocessor = FramePreprocessor()
         else:
             self.preprocessor = None
@@ -55,8 +61,8 @@ class AppController:
         if Parameters.MAVLINK_ENABLED:
             self.mavlink_data_manager.start_polling()
 
-        # Initialize the estimator
-        self.estimator = create_estimator(Parameters.ESTIMATOR_TYPE)
+        # Initialize the estimator (trackers only use it when USE_ESTIMATOR is set)
+        self.estimator = create_estimator(Parameters.ESTIMATOR_TYPE) if Parameters.USE_ESTIMATOR else None
 
         # Initialize video processing components
         self.video_handler = VideoHandler()
@@ -75,7 +81,7 @@ class AppController:
 
         # Flags and attributes for Smart Mode (YOLO-based)
         self.smart_mode_active = False
-        self.smart_tracker: Optional[SmartTracker] = None
+        self.smart_tracker: Optional["SmartTracker"] = None
         self.selected_bbox: Optional[Tuple[int, int, int, int]] = None
 
         # Setup video window and mouse callback if enabled
@@ -102,12 +108,37 @@ class AppController:
         self.osd_handler = OSDHandler(self)
         
         # Initialize GStreamer streaming if enabled
+        self.gstreamer_handler = None
         if Parameters.ENABLE_GSTREAMER_STREAM:
+            from classes.gstreamer_handler import GStreamerHandler
             self.gstreamer_handler = GStreamerHandler()
             self.gstreamer_handler.initialize_stream()
 
+        # Snapshot the configuration read on every frame
+        self.reload_parameters()
+
         logging.info("AppController initialized.")
 
+    def reload_parameters(self):
+        """
+        Re-reads the preprocessing, overlay, redetection and streaming settings that
+        update_loop() checks every frame.
+        """
+        self._enable_preprocessing = bool(Parameters.ENABLE_PREPROCESSING) and self.preprocessor is not None
+        self._enable_debugging = bool(Parameters.ENABLE_DEBUGGING)
+        self._template_update_confidence = Parameters.TRACKER_CONFIDENCE_THRESHOLD_FOR_TEMPLATE_UPDATE
+        self._template_update_interval = Parameters.TEMPLATE_UPDATE_INTERVAL
+        self._tracking_failure_timeout = Parameters.TRACKING_FAILURE_TIMEOUT
+        self._auto_redetect = bool(Parameters.USE_DETECTOR and Parameters.AUTO_REDETECT)
+        self._use_estimator_for_following = bool(Parameters.USE_ESTIMATOR_FOR_FOLLOWING)
+        self._stream_size = (Parameters.STREAM_WIDTH, Parameters.STREAM_HEIGHT)
+        self._gstream_enabled = bool(Parameters.ENABLE_GSTREAMER_STREAM) and self.gstreamer_handler is not None
+        self._draw_overlay = bool(getattr(Parameters, 'ENABLE_OVERLAY', True))  # Optional key; older configs lack it
+
+        # Optional per-frame stages, resolved once so disabled ones cost a single None check
+        self._preprocess = self.preprocessor.preprocess if self._enable_preprocessing else None
+        self._stream_sink = self.gstreamer_handler.enqueue_frame if self._gstream_enabled else None
+
     def on_mouse_click(self, event: int, x: int, y: int, flags: int, param: any):
         """
         Mouse callback for user interactions.
@@ -157,10 +188,6 @@ class AppController:
                 self.tracker.start_tracking(frame, bbox)
                 self.tracking_started = True
                 self.frame_counter = 0  # Reset frame counter
-                if self.detector:
-                    # Initialize detector features and template
-                    self.detector.extract_features(frame, bbox)
-                    logging.debug("Detector's features and template set.")
                 logging.info("Classic tracking activated.")
             else:
                 logging.info("Tracking canceled or invalid ROI.")
@@ -180,6 +207,7 @@ class AppController:
 
             if self.smart_tracker is None:
                 try:
+                    from classes.smart_tracker import SmartTracker
                     self.smart_tracker = SmartTracker(app_controller=self)
                     logging.info("SmartTracker mode activated.")
                 except Exception as e:
@@ -213,8 +241,6 @@ class AppController:
             bbox_tuple = (bbox['x'], bbox['y'], bbox['width'], bbox['height'])
             self.tracker.start_tracking(self.current_frame, bbox_tuple)
             self.tracking_started = True
-            if hasattr(self.tracker, 'detector') and self.tracker.detector:
-                self.tracker.detector.extract_features(self.current_frame, bbox_tuple)
             logging.info("Tracking activated.")
         else:
             logging.info("Tracking is already active.")
@@ -268,8 +294,8 @@ class AppController:
         """
         try:
             # Preprocess the frame if enabled
-            if Parameters.ENABLE_PREPROCESSING and self.preprocessor:
-                frame = self.preprocessor.preprocess(frame)
+            if self._preprocess is not None:
+                frame = self._preprocess(frame)
             
             # Apply segmentation if active (applies regardless of mode)
             if self.segmentation_active:
@@ -298,11 +324,13 @@ class AppController:
                     success, _ = self.tracker.update(frame)
                 if success:
                     self.tracking_failure_start_time = None
-                    frame = self.tracker.draw_tracking(frame, tracking_successful=True)
-                    if Parameters.ENABLE_DEBUGGING:
+                    if self._draw_overlay:
+                        frame = self.tracker.draw_overlay(
+                            frame, tracking_successful=True,
+                            draw_estimate=self.tracker.position_estimator is not None
+                        )
+                    if self._enable_debugging:
                         self.tracker.print_normalized_center()
-                    if self.tracker.position_estimator:
-                        frame = self.tracker.draw_estimate(frame, tracking_successful=True)
                     if self.following_active:
                         await self.follow_target()
                         await self.check_failsafe()
@@ -310,8 +338,8 @@ class AppController:
                     self.frame_counter += 1
                     tracker_confidence = self.tracker.get_confidence()
                     if not self.smart_mode_active:
-                        if (tracker_confidence >= Parameters.TRACKER_CONFIDENCE_THRESHOLD_FOR_TEMPLATE_UPDATE and
-                            self.frame_counter % Parameters.TEMPLATE_UPDATE_INTERVAL == 0):
+                        if (tracker_confidence >= self._template_update_confidence and
+                            self.frame_counter % self._template_update_interval == 0):
                             bbox = self.tracker.bbox
                             if bbox:
                                 self.detector.update_template(frame, bbox)
@@ -324,14 +352,15 @@ class AppController:
                         logging.warning("Tracking lost. Starting failure timer.")
                     else:
                         elapsed_time = time.time() - self.tracking_failure_start_time
-                        if elapsed_time > Parameters.TRACKING_FAILURE_TIMEOUT:
+                        if elapsed_time > self._tracking_failure_timeout:
                             logging.error("Tracking lost for too long. Handling failure.")
                             self.tracking_started = False
                             self.tracking_failure_start_time = None
                         else:
                             logging.warning(f"Tracking lost. Attempting recovery. Elapsed time: {elapsed_time:.2f} sec.")
                             self.tracker.update_estimator_without_measurement()
-                            frame = self.tracker.draw_estimate(frame, tracking_successful=False)
+                            if self._draw_overlay:
+                                frame = self.tracker.draw_estimate(frame, tracking_successful=False)
                             if self.following_active:
                                 await self.follow_target()
                                 await self.check_failsafe()
@@ -351,14 +380,12 @@ class AppController:
             # Draw OSD elements on frame
             frame = self.osd_handler.draw_osd(frame)
 
-            # GStreamer streaming if enabled
-            if Parameters.ENABLE_GSTREAMER_STREAM and hasattr(self, 'gstreamer_handler'):
-                self.gstreamer_handler.stream_frame(frame)
+            # Hand the frame to the GStreamer writer thread (never blocks, drops oldest)
+            if self._stream_sink is not None:
+                self._stream_sink(frame)
 
             # Update resized frames for streaming
-            self.video_handler.update_resized_frames(
-                Parameters.STREAM_WIDTH, Parameters.STREAM_HEIGHT
-            )
+            self.video_handler.update_resized_frames(*self._stream_size)
 
         except Exception as e:
             logging.exception(f"Error in update_loop: {e}")
@@ -369,7 +396,7 @@ class AppController:
         Handles tracking failure by attempting re-detection using the detector.
         Only used in classic mode.
         """
-        if Parameters.USE_DETECTOR and Parameters.AUTO_REDETECT:
+        if self._auto_redetect:
             logging.info("Attempting to re-detect the target using the detector.")
             redetect_result = self.initiate_redetection()
             if redetect_result["success"]:
@@ -435,7 +462,15 @@ class AppController:
     def identify_clicked_object(self, detections: list, x: int, y: int) -> Optional[Tuple[int, int, int, int]]:
         """
         Identifies the clicked object based on segmentation detections.
+        Uses a vectorized hit test when the detections match the segmentor's cached box array.
         """
+        boxes = self.segmentor.get_last_detections_array()
+        if boxes is not None and detections is self.segmentor.get_last_detections():
+            hit = (boxes[:, 0] <= x) & (x <= boxes[:, 2]) & (boxes[:, 1] <= y) & (y <= boxes[:, 3])
+            if hit.any():
+                return detections[int(hit.argmax())]
+            return None
+
         for det in detections:
             x1, y1, x2, y2 = det
             if x1 <= x <= x2 and y1 <= y <= y2:
@@ -550,7 +585,7 @@ class AppController:
         if self.tracking_started and self.following_active:
             target_coords: Optional[Tuple[float, float]] = None
 
-            if Parameters.USE_ESTIMATOR_FOR_FOLLOWING and self.tracker.position_estimator:
+            if self._use_estimator_for_following and self.tracker.position_estimator:
                 frame_width, frame_height = self.video_handler.width, self.video_handler.height
                 normalized_estimate = self.tracker.position_estimator.get_normalized_estimate(
                     frame_width, frame_height
@@ -582,6 +617,13 @@ class AppController:
         else:
             return False
 
+    def shutdown_executor(self):
+        """
+        Shuts down the shared worker pool. Call only after the FastAPI server thread has stopped,
+        since its stream handlers submit frame encodes until then.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
     async def shutdown(self) -> Dict[str, any]:
         """
         Gracefully shuts down the application.
@@ -599,6 +641,9 @@ class AppController:
                     self.setpoint_sender.join()
                 self.following_active = False
 
+            if self.gstreamer_handler:
+                self.gstreamer_handler.release()
+
             self.video_handler.release()
             logging.debug("Video handler released.")
             result["steps"].append("Shutdown complete.")
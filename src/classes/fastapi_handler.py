@@ -36,6 +36,7 @@ class FastAPIHandler:
         self.app_controller = app_controller
         self.video_handler = app_controller.video_handler
         self.telemetry_handler = app_controller.telemetry_handler
+        self.executor = app_controller.executor
 
         # Initialize WebRTC Manager
         self.webrtc_manager = WebRTCManager(self.video_handler)
@@ -224,6 +225,21 @@ class FastAPIHandler:
 
 
 
+    async def encode_frame(self, frame):
+        """
+        JPEG-encodes a frame on the shared executor so the server's event loop is not blocked.
+
+        Args:
+            frame (np.ndarray): The frame to encode.
+
+        Returns:
+            tuple: (success flag, encoded buffer) as returned by cv2.imencode.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, cv2.imencode, '.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), self.quality]
+        )
+
     async def video_feed(self):
         """
         FastAPI route to serve the video feed over HTTP as an MJPEG stream.
@@ -249,7 +265,7 @@ class FastAPIHandler:
                         self.logger.warning("No frame available to send (HTTP)")
                         break
 
-                    ret, buffer = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), self.quality])
+                    ret, buffer = await self.encode_frame(frame)
                     if ret:
                         frame_bytes = buffer.tobytes()
                         # Yield MJPEG frame
@@ -280,7 +296,7 @@ class FastAPIHandler:
                              if self.processed_osd
                              else self.video_handler.current_resized_raw_frame)
                     if frame is not None:
-                        ret, buffer = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), self.quality])
+                        ret, buffer = await self.encode_frame(frame)
                         if ret:
                             await websocket.send_bytes(buffer.tobytes())
                         else:
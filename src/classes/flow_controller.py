@@ -75,6 +75,7 @@ class FlowController:
         loop.run_until_complete(self.controller.shutdown())
         self.server.should_exit = True
         self.server_thread.join()  # Wait for the FastAPI server thread to finish
+        self.controller.shutdown_executor()  # Safe now: no stream handler can submit work any more
         if Parameters.SHOW_VIDEO_WINDOW:
             cv2.destroyAllWindows()
         logging.debug("Application shutdown complete.")
@@ -20,7 +20,7 @@ class Follower:
         Initializes the Follower with the PX4 controller and initial target coordinates.
 
         Args:
-            px4_controller (PX4Controller): The PX4 controller instance for controlling the drone.
+            px4_controller (PX4InterfaceManager): The PX4 interface instance for controlling the drone.
             initial_target_coords (tuple): Initial target coordinates for the follower.
 
         Raises:
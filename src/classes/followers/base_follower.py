@@ -16,7 +16,7 @@ class BaseFollower(ABC):
         Initializes the BaseFollower with the given PX4 controller and a SetpointHandler for managing setpoints.
 
         Args:
-            px4_controller (PX4Controller): Instance of PX4Controller to control the drone.
+            px4_controller (PX4InterfaceManager): Instance of PX4InterfaceManager to control the drone.
             profile_name (str): The name of the setpoint profile to use (e.g., "Ground View", "Constant Position").
         """
         self.px4_controller = px4_controller
@@ -24,6 +24,27 @@ class BaseFollower(ABC):
         self.latest_velocities = {'timestamp': None, 'status': 'idle'}
         logger.info(f"BaseFollower initialized with profile: {profile_name}")
 
+    @staticmethod
+    def _flatten_gains(gain_table: Dict[str, Dict[str, float]]) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Converts a {axis: {'p', 'i', 'd'}} gain table into {axis: (p, i, d)} tuples,
+        so control ticks can assign PID tunings without per-key dict lookups.
+
+        Args:
+            gain_table (dict): Gain table as loaded from the configuration.
+
+        Returns:
+            dict: Mapping of axis name to an immutable (p, i, d) tuple.
+        """
+        return {axis: (gains['p'], gains['i'], gains['d']) for axis, gains in gain_table.items()}
+
+    def reload_parameters(self):
+        """
+        Hook for followers to copy the Parameters values their control tick reads into
+        attributes. Subclasses call it from __init__; call it again after runtime tuning.
+        """
+        pass
+
     @abstractmethod
     def calculate_control_commands(self, target_coords: Tuple[float, float]) -> None:
         """
@@ -4,7 +4,7 @@ from classes.followers.custom_pid import CustomPID
 from classes.parameters import Parameters
 import logging
 from typing import Tuple
-import numpy as np
+import math
 
 class ChaseFollower(BaseFollower):
     """
@@ -17,13 +17,22 @@ class ChaseFollower(BaseFollower):
         Initializes the ChaseFollower with the given PX4 controller and initial target coordinates.
 
         Args:
-            px4_controller (PX4Controller): Instance of PX4Controller to control the drone.
+            px4_controller (PX4InterfaceManager): Instance of PX4InterfaceManager to control the drone.
             initial_target_coords (tuple): Initial target coordinates to set for the follower.
         """
         super().__init__(px4_controller, "Chase Follower")  # Initialize with "Chase Follower" profile
         self.initial_target_coords = initial_target_coords
+        self._default_gains = self._flatten_gains(Parameters.PID_GAINS)
+        self.reload_parameters()
         self.initialize_pids()
         self.dive_started = False
+
+    def reload_parameters(self):
+        self._yaw_error_check_enabled = bool(Parameters.YAW_ERROR_CHECK_ENABLED)
+        self._yaw_error_threshold = Parameters.YAW_ERROR_THRESHOLD
+        self._altitude_failsafe_enabled = bool(Parameters.ALTITUDE_FAILSAFE_ENABLED)
+        self._min_descent_height = Parameters.MIN_DESCENT_HEIGHT
+        self._max_climb_height = Parameters.MAX_CLIMB_HEIGHT
         
     def initialize_pids(self):
         """
@@ -65,8 +74,8 @@ class ChaseFollower(BaseFollower):
         Returns:
             Tuple[float, float, float]: The proportional, integral, and derivative gains for the axis.
         """
-        # Return the PID gains from the parameters
-        return Parameters.PID_GAINS[axis]['p'], Parameters.PID_GAINS[axis]['i'], Parameters.PID_GAINS[axis]['d']
+        # Return the PID gains precomputed from the parameters
+        return self._default_gains[axis]
 
     def update_pid_gains(self):
         """
@@ -86,8 +95,7 @@ class ChaseFollower(BaseFollower):
         Args:
             target_coords (Tuple[float, float]): The target coordinates from image processing.
         """
-        # Update PID gains
-        self.update_pid_gains()
+        # Gains are fixed for this follower; they are applied once in initialize_pids()
 
         # Calculate errors for pitch (vertical) and yaw (horizontal)
         error_y = (self.pid_pitch_rate.setpoint - target_coords[1]) * (-1)
@@ -110,17 +118,17 @@ class ChaseFollower(BaseFollower):
         self.check_yaw_and_control(yaw_error, pitch_rate,thrust)
 
         # Convert yaw rate from degrees/sec to radians/sec
-        yaw_rate_rad = yaw_rate * (np.pi / 180)
+        yaw_rate_rad = math.radians(yaw_rate)
 
         
         logging.debug(f"Current Roll: {current_roll:.2f}, Current Speed: {current_speed:.2f}")
 
         # Calculate the desired bank angle from yaw rate and speed
         g = 9.81  # Acceleration due to gravity in m/s^2
-        target_bank_angle_rad = np.arctan((yaw_rate_rad * current_speed) / g)
+        target_bank_angle_rad = math.atan((yaw_rate_rad * current_speed) / g)
 
         # Convert the bank angle from radians to degrees
-        target_bank_angle = np.degrees(target_bank_angle_rad)
+        target_bank_angle = math.degrees(target_bank_angle_rad)
 
         # Calculate the error between desired and current bank angle
         bank_angle_error = (-1) * (target_bank_angle - current_roll)
@@ -148,14 +156,14 @@ class ChaseFollower(BaseFollower):
             yaw_error (float): The current yaw error of the drone.
             pitch_command (float): The pitch command to be potentially sent.
         """
-        if Parameters.YAW_ERROR_CHECK_ENABLED & ~self.dive_started:
-            if abs(yaw_error) < Parameters.YAW_ERROR_THRESHOLD:
+        if self._yaw_error_check_enabled & ~self.dive_started:
+            if abs(yaw_error) < self._yaw_error_threshold:
                 self.px4_controller.setpoint_handler.set_field('pitch_rate', pitch_command)
                 self.px4_controller.setpoint_handler.set_field('thrust', self.px4_controller.hover_throttle) # keep sending hover throttle
                 logging.debug(f"Pitch and throttle command sent: {pitch_command:.2f}, {thrust_command:.2f}")
                 self.dive_started = True
             else:
-                logging.info(f"Yaw error {yaw_error:.2f} exceeds threshold {Parameters.YAW_ERROR_THRESHOLD}. Pitch and thrust command not sent.")
+                logging.info(f"Yaw error {yaw_error:.2f} exceeds threshold {self._yaw_error_threshold}. Pitch and thrust command not sent.")
                 self.px4_controller.setpoint_handler.set_field('thrust', self.px4_controller.hover_throttle) # keep sending hover throttle
         else:
             self.px4_controller.setpoint_handler.set_field('pitch_rate', pitch_command)
@@ -208,9 +216,9 @@ class ChaseFollower(BaseFollower):
         return max(0.0, min(1.0, normalized_speed))
     
     def check_altitude_safety(self):
-        if Parameters.ALTITUDE_FAILSAFE_ENABLED:
+        if self._altitude_failsafe_enabled:
             current_altitude = self.px4_controller.current_altitude
-            if current_altitude < Parameters.MIN_DESCENT_HEIGHT or current_altitude > Parameters.MAX_CLIMB_HEIGHT:
+            if current_altitude < self._min_descent_height or current_altitude > self._max_climb_height:
                 logging.warning(f"Altitude safety triggered! Current altitude: {current_altitude}")
                 self.px4_controller.app_controller.disconnect_px4()
                 #self.px4_controller.failsafe_active = True
@@ -16,14 +16,21 @@ class ConstantDistanceFollower(BaseFollower):
         Initializes the ConstantDistanceFollower with the given PX4 controller and initial target coordinates.
 
         Args:
-            px4_controller (PX4Controller): Instance of PX4Controller to control the drone.
+            px4_controller (PX4InterfaceManager): Instance of PX4InterfaceManager to control the drone.
             initial_target_coords (tuple): Initial target coordinates to set for the follower.
         """
         super().__init__(px4_controller, "Constant Distance")  # Initialize with "Constant Distance" profile
         self.yaw_enabled = Parameters.ENABLE_YAW_CONTROL
         self.initial_target_coords = initial_target_coords
+        self._default_gains = self._flatten_gains(Parameters.PID_GAINS)
+        self.reload_parameters()
         self.initialize_pids()
 
+    def reload_parameters(self):
+        self._yaw_control_threshold = Parameters.YAW_CONTROL_THRESHOLD
+        self._min_descent_height = Parameters.MIN_DESCENT_HEIGHT
+        self._max_climb_height = Parameters.MAX_CLIMB_HEIGHT
+
     def initialize_pids(self):
         """
         Initializes the PID controllers for maintaining a constant distance from the target.
@@ -62,8 +69,8 @@ class ConstantDistanceFollower(BaseFollower):
         Returns:
             Tuple[float, float, float]: The proportional, integral, and derivative gains for the axis.
         """
-        # Return the PID gains from the parameters
-        return Parameters.PID_GAINS[axis]['p'], Parameters.PID_GAINS[axis]['i'], Parameters.PID_GAINS[axis]['d']
+        # Return the PID gains precomputed from the parameters
+        return self._default_gains[axis]
 
     def update_pid_gains(self):
         """
@@ -83,8 +90,7 @@ class ConstantDistanceFollower(BaseFollower):
         Args:
             target_coords (Tuple[float, float]): The target coordinates from image processing.
         """
-        # Update PID gains
-        self.update_pid_gains()
+        # Gains are fixed for this follower; they are applied once in initialize_pids()
 
         # Calculate errors for Y and Z axes
         error_x = self.pid_y.setpoint - target_coords[0]
@@ -97,14 +103,13 @@ class ConstantDistanceFollower(BaseFollower):
 
         # Handle yaw control if enabled
         yaw_velocity = 0
-        if self.yaw_enabled and abs(error_x) > Parameters.YAW_CONTROL_THRESHOLD:
+        if self.yaw_enabled and abs(error_x) > self._yaw_control_threshold:
             yaw_velocity = self.pid_yaw_rate(error_x)
 
         # Update the setpoint handler
-        self.px4_controller.setpoint_handler.set_field('vel_x', vel_x)
-        self.px4_controller.setpoint_handler.set_field('vel_y', vel_y)
-        self.px4_controller.setpoint_handler.set_field('vel_z', vel_z)
-        self.px4_controller.setpoint_handler.set_field('yaw_rate', yaw_velocity)
+        self.px4_controller.setpoint_handler.set_fields({
+            'vel_x': vel_x, 'vel_y': vel_y, 'vel_z': vel_z, 'yaw_rate': yaw_velocity
+        })
 
         # Log the calculated velocity commands
         logging.debug(f"Calculated velocities - Vx: {vel_x}, Vy: {vel_y}, Vz: {vel_z}, Yaw rate: {yaw_velocity}")
@@ -131,16 +136,17 @@ class ConstantDistanceFollower(BaseFollower):
             float: The calculated Z-axis velocity (descent or climb command).
         """
         current_altitude = self.px4_controller.current_altitude
-        logging.debug(f"Current Altitude: {current_altitude}m, "
-                      f"Minimum Descent Height: {Parameters.MIN_DESCENT_HEIGHT}m, "
-                      f"Maximum Climb Height: {Parameters.MAX_CLIMB_HEIGHT}m")
+        min_descent_height = self._min_descent_height
+        max_climb_height = self._max_climb_height
+        logging.debug("Current Altitude: %sm, Minimum Descent Height: %sm, Maximum Climb Height: %sm",
+                      current_altitude, min_descent_height, max_climb_height)
 
         # Calculate the PID-controlled vertical command (Z velocity)
         command = self.pid_z(error_y)
 
         # Handle descent command
         if command > 0:  # Descending
-            if current_altitude >= Parameters.MIN_DESCENT_HEIGHT:
+            if current_altitude >= min_descent_height:
                 return command
             else:
                 logging.info("Altitude is at or above the minimum descent height. Descent halted.")
@@ -148,7 +154,7 @@ class ConstantDistanceFollower(BaseFollower):
 
         # Handle climb command
         else:  # Climbing
-            if current_altitude < Parameters.MAX_CLIMB_HEIGHT:
+            if current_altitude < max_climb_height:
                 return command
             else:
                 logging.info("Already at maximum altitude. No further climb allowed.")
@@ -16,15 +16,22 @@ class ConstantPositionFollower(BaseFollower):
         Initializes the ConstantPositionFollower with the given PX4 controller and initial target coordinates.
 
         Args:
-            px4_controller (PX4Controller): Instance of PX4Controller to control the drone.
+            px4_controller (PX4InterfaceManager): Instance of PX4InterfaceManager to control the drone.
             initial_target_coords (tuple): Initial target coordinates to set for the follower.
         """
         super().__init__(px4_controller, "Constant Position")  # Initialize with "Constant Position" profile
         self.yaw_enabled = True  # Yaw control is always enabled in this mode
         self.altitude_control_enabled = Parameters.ENABLE_ALTITUDE_CONTROL
         self.initial_target_coords = initial_target_coords
+        self._default_gains = self._flatten_gains(Parameters.PID_GAINS)
+        self.reload_parameters()
         self.initialize_pids()
 
+    def reload_parameters(self):
+        self._yaw_control_threshold = Parameters.YAW_CONTROL_THRESHOLD
+        self._min_descent_height = Parameters.MIN_DESCENT_HEIGHT
+        self._max_climb_height = Parameters.MAX_CLIMB_HEIGHT
+
     def initialize_pids(self):
         """
         Initializes the PID controllers for maintaining a constant position relative to the target.
@@ -58,8 +65,8 @@ class ConstantPositionFollower(BaseFollower):
         Returns:
             Tuple[float, float, float]: The proportional, integral, and derivative gains for the axis.
         """
-        # Return the PID gains from the parameters
-        return Parameters.PID_GAINS[axis]['p'], Parameters.PID_GAINS[axis]['i'], Parameters.PID_GAINS[axis]['d']
+        # Return the PID gains precomputed from the parameters
+        return self._default_gains[axis]
 
     def update_pid_gains(self):
         """
@@ -78,12 +85,11 @@ class ConstantPositionFollower(BaseFollower):
         Args:
             target_coords (Tuple[float, float]): The target coordinates from image processing.
         """
-        # Update PID gains
-        self.update_pid_gains()
+        # Gains are fixed for this follower; they are applied once in initialize_pids()
 
         # Calculate yaw control
         error_x = self.pid_yaw_rate.setpoint - target_coords[0]
-        yaw_velocity = self.pid_yaw_rate(error_x) if abs(error_x) > Parameters.YAW_CONTROL_THRESHOLD else 0
+        yaw_velocity = self.pid_yaw_rate(error_x) if abs(error_x) > self._yaw_control_threshold else 0
 
         # Calculate altitude control if enabled
         vel_z = 0
@@ -92,8 +98,7 @@ class ConstantPositionFollower(BaseFollower):
             vel_z = self.control_descent_constant_distance(error_y)
 
         # Update the setpoint handler
-        self.px4_controller.setpoint_handler.set_field('vel_z', vel_z)
-        self.px4_controller.setpoint_handler.set_field('yaw_rate', yaw_velocity)
+        self.px4_controller.setpoint_handler.set_fields({'vel_z': vel_z, 'yaw_rate': yaw_velocity})
 
         # Log the calculated velocity commands
         logging.debug(f"Calculated velocities - Vz: {vel_z}, Yaw rate: {yaw_velocity}")
@@ -120,16 +125,17 @@ class ConstantPositionFollower(BaseFollower):
             float: The calculated Z-axis velocity (descent or climb command).
         """
         current_altitude = self.px4_controller.current_altitude
-        logging.debug(f"Current Altitude: {current_altitude}m, "
-                      f"Minimum Descent Height: {Parameters.MIN_DESCENT_HEIGHT}m, "
-                      f"Maximum Climb Height: {Parameters.MAX_CLIMB_HEIGHT}m")
+        min_descent_height = self._min_descent_height
+        max_climb_height = self._max_climb_height
+        logging.debug("Current Altitude: %sm, Minimum Descent Height: %sm, Maximum Climb Height: %sm",
+                      current_altitude, min_descent_height, max_climb_height)
 
         # Calculate the PID-controlled vertical command (Z velocity)
         command = self.pid_z(error_y)
 
         # Handle descent command
         if command > 0:  # Descending
-            if current_altitude >= Parameters.MIN_DESCENT_HEIGHT:
+            if current_altitude >= min_descent_height:
                 return command
             else:
                 logging.info("Altitude is at or above the minimum descent height. Descent halted.")
@@ -137,7 +143,7 @@ class ConstantPositionFollower(BaseFollower):
 
         # Handle climb command
         else:  # Climbing
-            if current_altitude < Parameters.MAX_CLIMB_HEIGHT:
+            if current_altitude < max_climb_height:
                 return command
             else:
                 logging.info("Already at maximum altitude. No further climb allowed.")
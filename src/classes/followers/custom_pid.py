@@ -14,20 +14,26 @@ class CustomPID(PID):
         super().__init__(*args, **kwargs)
         self.last_output = 0  # Initialize last output for anti-windup calculation
 
+        # Feature flags are fixed for the controller's lifetime; bind them once instead of per call
+        self._proportional_on_measurement = Parameters.PROPORTIONAL_ON_MEASUREMENT
+        self._anti_windup = Parameters.ENABLE_ANTI_WINDUP
+        self._back_calc_coeff = Parameters.ANTI_WINDUP_BACK_CALC_COEFF
+
     def __call__(self, input_, dt=None):
         # Apply Proportional on Measurement if enabled
-        if Parameters.PROPORTIONAL_ON_MEASUREMENT:
+        if self._proportional_on_measurement:
             # Adjust the proportional error calculation to be based on the measurement
             self.proportional = self.Kp * (self.setpoint - input_)
         
         output = super().__call__(input_, dt)
 
         # Apply anti-windup correction if enabled
-        if Parameters.ENABLE_ANTI_WINDUP:
-            if output != self.last_output and (output >= self.output_limits[1] or output <= self.output_limits[0]):
+        if self._anti_windup and output != self.last_output:
+            lower, upper = self.output_limits
+            if output >= upper or output <= lower:
                 # Back-calculate to adjust the integral term
                 diff = output - self.last_output
-                self._integral -= diff * Parameters.ANTI_WINDUP_BACK_CALC_COEFF
+                self._integral -= diff * self._back_calc_coeff
 
         self.last_output = output  # Update last output
         return output
@@ -1,6 +1,8 @@
 from classes.followers.base_follower import BaseFollower
 from classes.followers.custom_pid import CustomPID
 from classes.parameters import Parameters
+import ast
+import bisect
 import logging
 from datetime import datetime
 from typing import Tuple, Dict
@@ -17,103 +19,131 @@ class GroundTargetFollower(BaseFollower):
         Initializes the GroundTargetFollower with the given PX4 controller and initial target coordinates.
 
         Args:
-            px4_controller (PX4Controller): Instance of PX4Controller to control the drone.
+            px4_controller (PX4InterfaceManager): Instance of PX4InterfaceManager to control the drone.
             initial_target_coords (tuple): Initial target coordinates to set for the follower.
         """
         super().__init__(px4_controller, "Ground View")  # Initialize with "Ground View" profile
         self.target_position_mode = Parameters.TARGET_POSITION_MODE
         self.initial_target_coords = initial_target_coords if self.target_position_mode == 'initial' else (0, 0)
+        self._default_gains = self._flatten_gains(Parameters.PID_GAINS)
+        self._schedule_rows = self._build_schedule_rows()
+        self._schedule_lows = [row[0] for row in self._schedule_rows]  # Sorted lower bounds, for bisect
+        self._last_bucket_idx = None
+        self._applied_gains = None  # Gain set last written to the PID controllers
+        self._descent_state = None  # 'disabled', 'active' or 'halted' on the previous tick, for transition logging
+        self.reload_parameters()
         self.initialize_pids()
 
+    def reload_parameters(self):
+        self._camera_gimbaled = Parameters.IS_CAMERA_GIMBALED
+        # Resolve the correction path once; get_orientation() is never called for a gimbaled camera
+        self._adjust = self._adjust_gimbaled if self._camera_gimbaled else self._adjust_non_gimbaled
+        self._base_adjustment = (Parameters.BASE_ADJUSTMENT_FACTOR_X, Parameters.BASE_ADJUSTMENT_FACTOR_Y)
+        self._altitude_factor = Parameters.ALTITUDE_FACTOR
+        self._enable_descend = bool(Parameters.ENABLE_DESCEND_TO_TARGET)
+        self._min_descent_height = Parameters.MIN_DESCENT_HEIGHT
+        self._enable_gain_scheduling = bool(Parameters.ENABLE_GAIN_SCHEDULING)
+        self._gain_scheduling_parameter = Parameters.GAIN_SCHEDULING_PARAMETER
+
     def initialize_pids(self):
         """Initializes the PID controllers based on the initial target coordinates."""
         setpoint_x, setpoint_y = self.initial_target_coords
-        self.pid_x = CustomPID(
-            *self.get_pid_gains('x'), 
-            setpoint=setpoint_x, 
-            output_limits=(-Parameters.VELOCITY_LIMITS['x'], Parameters.VELOCITY_LIMITS['x'])
-        )
-        self.pid_y = CustomPID(
-            *self.get_pid_gains('y'), 
-            setpoint=setpoint_y, 
-            output_limits=(-Parameters.VELOCITY_LIMITS['y'], Parameters.VELOCITY_LIMITS['y'])
-        )
-        self.pid_z = CustomPID(
-            *self.get_pid_gains('z'), 
-            setpoint=Parameters.MIN_DESCENT_HEIGHT, 
-            output_limits=(-Parameters.MAX_RATE_OF_DESCENT, Parameters.MAX_RATE_OF_DESCENT)
+        gains = self._active_gains()  # Resolve the gain schedule once for all axes
+
+        # (axis, setpoint, output limits)
+        pid_specs = (
+            ('x', setpoint_x, (-Parameters.VELOCITY_LIMITS['x'], Parameters.VELOCITY_LIMITS['x'])),
+            ('y', setpoint_y, (-Parameters.VELOCITY_LIMITS['y'], Parameters.VELOCITY_LIMITS['y'])),
+            ('z', Parameters.MIN_DESCENT_HEIGHT, (-Parameters.MAX_RATE_OF_DESCENT, Parameters.MAX_RATE_OF_DESCENT)),
         )
+        for axis, setpoint, output_limits in pid_specs:
+            setattr(self, f'pid_{axis}', CustomPID(*gains[axis], setpoint=setpoint, output_limits=output_limits))
+        self._applied_gains = gains
         logger.info("PID controllers initialized for GroundTargetFollower.")
 
-    def get_pid_gains(self, axis: str) -> Tuple[float, float, float]:
-        """Retrieves the PID gains based on the current altitude from the PX4Controller, applying gain scheduling if enabled."""
-        if Parameters.ENABLE_GAIN_SCHEDULING:
-            current_value = getattr(self.px4_controller, Parameters.GAIN_SCHEDULING_PARAMETER, None)
-            if current_value is None:
-                logger.error(f"Parameter {Parameters.GAIN_SCHEDULING_PARAMETER} not available in PX4Controller.")
-                return Parameters.PID_GAINS[axis]['p'], Parameters.PID_GAINS[axis]['i'], Parameters.PID_GAINS[axis]['d']
-            
-            for (lower_bound, upper_bound), gains in Parameters.ALTITUDE_GAIN_SCHEDULE.items():
-                if lower_bound <= current_value < upper_bound:
-                    return gains[axis]['p'], gains[axis]['i'], gains[axis]['d']
-        
-        return Parameters.PID_GAINS[axis]['p'], Parameters.PID_GAINS[axis]['i'], Parameters.PID_GAINS[axis]['d']
-
-    def update_pid_gains(self):
-        """Updates the PID gains based on current settings and altitude."""
-        self.pid_x.tunings = self.get_pid_gains('x')
-        self.pid_y.tunings = self.get_pid_gains('y')
-        self.pid_z.tunings = self.get_pid_gains('z')
-        logger.debug("PID gains updated for GroundTargetFollower.")
-
-    def apply_gimbal_corrections(self, target_coords: Tuple[float, float]) -> Tuple[float, float]:
+    def _build_schedule_rows(self):
         """
-        Applies orientation-based adjustments if the camera is not gimbaled.
-
-        Args:
-            target_coords (tuple): The target coordinates from image processing.
-
-        Returns:
-            tuple: Adjusted target coordinates considering gimbal corrections.
+        Parses ALTITUDE_GAIN_SCHEDULE once into (lower, upper, {axis: (p, i, d)}) rows, sorted by lower bound.
+        YAML delivers the bounds as '(lower, upper)' strings, so they are evaluated here rather than per tick.
+        """
+        rows = []
+        for bounds, gains in Parameters.ALTITUDE_GAIN_SCHEDULE.items():
+            lower_bound, upper_bound = ast.literal_eval(bounds) if isinstance(bounds, str) else bounds
+            rows.append((lower_bound, upper_bound, self._flatten_gains(gains)))
+        rows.sort(key=lambda row: row[0])
+        return rows
+
+    def _find_schedule_bucket(self, current_value: float):
         """
-        if Parameters.IS_CAMERA_GIMBALED:
-            return target_coords
+        Returns the index of the schedule row containing current_value, or None.
+        The previous tick's row is checked first since altitude rarely changes bucket between ticks;
+        otherwise the candidate row is found by bisecting the sorted lower bounds.
+        """
+        idx = self._last_bucket_idx
+        if idx is not None:
+            lower_bound, upper_bound, _ = self._schedule_rows[idx]
+            if lower_bound <= current_value < upper_bound:
+                return idx
+
+        idx = bisect.bisect_right(self._schedule_lows, current_value) - 1
+        if idx >= 0 and current_value < self._schedule_rows[idx][1]:
+            self._last_bucket_idx = idx
+            return idx
+        return None
+
+    def _active_gains(self) -> Dict:
+        """Returns the {axis: (p, i, d)} gains for the current altitude, falling back to PID_GAINS."""
+        if self._enable_gain_scheduling:
+            current_value = getattr(self.px4_controller, self._gain_scheduling_parameter, None)
+            if current_value is None:
+                logger.error(f"Parameter {self._gain_scheduling_parameter} not available in PX4InterfaceManager.")
+                return self._default_gains
 
-        orientation = self.px4_controller.get_orientation()  # (yaw, pitch, roll)
-        roll = orientation[2]
-        pitch = orientation[1]
+            idx = self._find_schedule_bucket(current_value)
+            if idx is not None:
+                return self._schedule_rows[idx][2]
 
-        adjusted_target_x = target_coords[0] + Parameters.BASE_ADJUSTMENT_FACTOR_X * roll
-        adjusted_target_y = target_coords[1] - Parameters.BASE_ADJUSTMENT_FACTOR_Y * pitch
+        return self._default_gains
 
-        return adjusted_target_x, adjusted_target_y
+    def get_pid_gains(self, axis: str) -> Tuple[float, float, float]:
+        """Retrieves the PID gains based on the current altitude from the PX4InterfaceManager, applying gain scheduling if enabled."""
+        return self._active_gains()[axis]
 
-    def apply_adjustment_factors(self, adjusted_target_x: float, adjusted_target_y: float) -> Tuple[float, float]:
+    def update_pid_gains(self):
         """
-        Applies dynamic adjustment factors based on the altitude.
-
-        Args:
-            adjusted_target_x (float): The adjusted target x-coordinate.
-            adjusted_target_y (float): The adjusted target y-coordinate.
-
-        Returns:
-            tuple: Further adjusted target coordinates.
+        Updates the PID gains based on current settings and altitude, resolving the schedule once for all axes.
+        The controllers are only re-tuned when the active gain set changes; with scheduling disabled that is the first tick only.
         """
-        current_altitude = self.px4_controller.current_altitude
-        adj_factor_x = Parameters.BASE_ADJUSTMENT_FACTOR_X / (1 + Parameters.ALTITUDE_FACTOR * current_altitude)
-        adj_factor_y = Parameters.BASE_ADJUSTMENT_FACTOR_Y / (1 + Parameters.ALTITUDE_FACTOR * current_altitude)
-
-        adjusted_target_x += adj_factor_x
-        adjusted_target_y += adj_factor_y
+        gains = self._active_gains()
+        if gains is self._applied_gains:
+            return
+        self._applied_gains = gains
+        self.pid_x.tunings = gains['x']
+        self.pid_y.tunings = gains['y']
+        self.pid_z.tunings = gains['z']
+        logger.debug("PID gains updated for GroundTargetFollower.")
 
-        return adjusted_target_x, adjusted_target_y
+    def _adjust_gimbaled(self, target_coords: Tuple[float, float]) -> Tuple[float, float]:
+        """Gimbaled camera: the image is already stabilized, so only the altitude adjustment applies."""
+        target_x, target_y = target_coords
+        base_x, base_y = self._base_adjustment
+        altitude_scale = 1 / (1 + self._altitude_factor * self.px4_controller.current_altitude)
+        return target_x + base_x * altitude_scale, target_y + base_y * altitude_scale
+
+    def _adjust_non_gimbaled(self, target_coords: Tuple[float, float]) -> Tuple[float, float]:
+        """Body-fixed camera: compensates roll and pitch, then applies the altitude adjustment."""
+        target_x, target_y = target_coords
+        base_x, base_y = self._base_adjustment
+        _, pitch, roll = self.px4_controller.get_orientation()  # (yaw, pitch, roll)
+        altitude_scale = 1 / (1 + self._altitude_factor * self.px4_controller.current_altitude)
+        return (target_x + base_x * (roll + altitude_scale),
+                target_y + base_y * (altitude_scale - pitch))
 
     def calculate_control_commands(self, target_coords: Tuple[float, float]) -> None:
         """Calculates and updates velocity commands based on the target coordinates."""
         self.update_pid_gains()
 
-        adjusted_target_x, adjusted_target_y = self.apply_gimbal_corrections(target_coords)
-        adjusted_target_x, adjusted_target_y = self.apply_adjustment_factors(adjusted_target_x, adjusted_target_y)
+        adjusted_target_x, adjusted_target_y = self._adjust(target_coords)
 
         # Calculate errors
         error_x = self.pid_x.setpoint - adjusted_target_x
@@ -125,9 +155,7 @@ class GroundTargetFollower(BaseFollower):
         vel_z = self.control_descent()
         
         # Update setpoint handler with calculated velocities
-        self.px4_controller.setpoint_handler.set_field('vel_x', vel_x)
-        self.px4_controller.setpoint_handler.set_field('vel_y', vel_y)
-        self.px4_controller.setpoint_handler.set_field('vel_z', vel_z)
+        self.px4_controller.setpoint_handler.set_fields({'vel_x': vel_x, 'vel_y': vel_y, 'vel_z': vel_z})
         logger.debug(f"Velocity commands calculated: vel_x={vel_x}, vel_y={vel_y}, vel_z={vel_z}")
 
     def follow_target(self, target_coords: Tuple[float, float]):
@@ -140,15 +168,22 @@ class GroundTargetFollower(BaseFollower):
         """
         Controls the descent of the drone based on current altitude, ensuring it doesn't go below the minimum descent height.
         """
-        if not Parameters.ENABLE_DESCEND_TO_TARGET:
-            logging.info("Descending to target is disabled.")
+        if not self._enable_descend:
+            self._set_descent_state('disabled', "Descending to target is disabled.")
             return 0
 
         current_altitude = self.px4_controller.current_altitude
-        logging.debug(f"Current Altitude: {current_altitude}m, Minimum Descent Height: {Parameters.MIN_DESCENT_HEIGHT}m")
+        min_descent_height = self._min_descent_height
+        logging.debug("Current Altitude: %sm, Minimum Descent Height: %sm", current_altitude, min_descent_height)
 
-        if current_altitude > Parameters.MIN_DESCENT_HEIGHT:
+        if current_altitude > min_descent_height:
+            self._set_descent_state('active', "Altitude is above the minimum descent height. Descending.")
             return self.pid_z(-current_altitude)
-        else:
-            logging.info("Altitude is at or below the minimum descent height. Descent halted.")
-            return 0
+        self._set_descent_state('halted', "Altitude is at or below the minimum descent height. Descent halted.")
+        return 0
+
+    def _set_descent_state(self, state: str, message: str):
+        """Records the descent state and logs the message only when the state changes, not every tick."""
+        if state != self._descent_state:
+            logging.info(message)
+            self._descent_state = state
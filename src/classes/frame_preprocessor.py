@@ -1,6 +1,7 @@
 # src/classes/frame_preprocessor.py
 
 import cv2
+import logging
 import numpy as np
 from classes.parameters import Parameters
 
@@ -32,6 +33,15 @@ class FramePreprocessor:
 
         # Additional techniques can be appended here
 
+        # Optionally offload the chain to an OpenCL device; falls back to ndarrays when none is present
+        opencl_requested = bool(getattr(Parameters, 'PREPROCESSING_USE_OPENCL', False))  # Optional key; older configs lack it
+        self.use_opencl = opencl_requested and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+            logging.info("Frame preprocessing will run through OpenCL (cv2.UMat).")
+        elif opencl_requested:
+            logging.warning("OpenCL requested for preprocessing but not available; using the CPU path.")
+
     def preprocess(self, frame: np.ndarray) -> np.ndarray:
         """
         Applies the selected preprocessing techniques to the given frame.
@@ -42,6 +52,13 @@ class FramePreprocessor:
         Returns:
             np.ndarray: The preprocessed video frame.
         """
+        if self.use_opencl and self.techniques:
+            # Upload once, run every technique on the device, download once
+            frame = cv2.UMat(frame)
+            for technique in self.techniques:
+                frame = technique(frame)
+            return frame.get()
+
         for technique in self.techniques:
             frame = technique(frame)
         return frame
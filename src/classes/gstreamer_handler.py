@@ -1,6 +1,8 @@
 import cv2
 import numpy as np
 import logging
+import queue
+import threading
 from classes.parameters import Parameters
 
 class GStreamerHandler:
@@ -20,6 +22,9 @@ class GStreamerHandler:
        - OpenCV typically works with frames in BGR format, while the NVIDIA encoder (`nvvidconv`) and GStreamer pipeline 
          may require NV12 or other formats. Conversion is handled using `videoconvert`.
        - Ensure frames are in 8-bit, 3-channel BGR format before pushing them into the pipeline.
+       - The BGR -> NV12 conversion deliberately stays inside the pipeline: `cv2.VideoWriter` only negotiates BGR or
+         GRAY8 caps on `appsrc`, and the tracker and OSD need full-colour frames, so converting to YUV420 in Python
+         would add a conversion rather than remove one.
 
     3. Bitrate and Encoding Settings:
        - Bitrate is critical for balancing video quality and network bandwidth. It is specified in kbps.
@@ -37,6 +42,15 @@ class GStreamerHandler:
     6. Buffer Size:
        - The UDP buffer size is configured to handle network jitter and ensure smooth streaming. Adjust based on network 
          conditions and application requirements.
+
+    7. Staging Buffer:
+       - Frames whose size does not match the pipeline caps are resized into a preallocated staging array that is 
+         reused every frame, so the writer always receives a caps-compatible buffer without a per-frame allocation. 
+         Only the writer thread touches it.
+
+    8. Decoupled Encoding:
+       - Frames are handed over through a small bounded queue to a writer thread. When the encoder falls behind, the 
+         oldest queued frame is dropped, so a stalled encoder never stalls the capture/tracking loop.
     """
 
     def __init__(self):
@@ -49,6 +63,9 @@ class GStreamerHandler:
         self.WIDTH = Parameters.GSTREAMER_WIDTH
         self.HEIGHT = Parameters.GSTREAMER_HEIGHT
         self.FRAMERATE = Parameters.GSTREAMER_FRAMERATE
+        self._staging = np.empty((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)  # Resize target for off-size frames
+        self.frame_queue = queue.Queue(maxsize=2)
+        self._worker = None
 
         self.pipeline = self._create_pipeline()
 
@@ -93,6 +110,40 @@ class GStreamerHandler:
             logging.error(f"Error initializing GStreamer pipeline: {e}")
             self.out = None
 
+        if self.out and self._worker is None:
+            self._worker = threading.Thread(target=self._stream_worker, daemon=True)
+            self._worker.start()
+
+    def enqueue_frame(self, frame: np.ndarray):
+        """
+        Hands a frame to the writer thread without blocking. If the queue is full,
+        the oldest pending frame is dropped in favour of the new one.
+
+        Args:
+            frame (np.ndarray): The video frame to stream.
+        """
+        if self._worker is None:
+            return
+        while True:
+            try:
+                self.frame_queue.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self.frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _stream_worker(self):
+        """
+        Writer thread: pushes queued frames into the pipeline until a None sentinel arrives.
+        """
+        while True:
+            frame = self.frame_queue.get()
+            if frame is None:
+                break
+            self.stream_frame(frame)
+
     def stream_frame(self, frame: np.ndarray):
         """
         Streams a video frame to the GStreamer pipeline.
@@ -107,7 +158,11 @@ class GStreamerHandler:
                     frame = frame.astype(np.uint8)
                 if len(frame.shape) == 2 or frame.shape[2] != 3:
                     frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-                self.out.write(frame)
+                if frame.shape[:2] != (self.HEIGHT, self.WIDTH):
+                    # Resize into the staging array; write() copies it synchronously
+                    self.out.write(cv2.resize(frame, (self.WIDTH, self.HEIGHT), dst=self._staging))
+                else:
+                    self.out.write(frame)
             except Exception as e:
                 logging.error(f"Error streaming frame to GStreamer pipeline: {e}")
 
@@ -116,6 +171,16 @@ class GStreamerHandler:
         Releases the GStreamer pipeline and associated resources.
         This should be called to clean up resources when streaming is no longer needed.
         """
+        if self._worker is not None:
+            # Discard pending frames and wake the writer with the stop sentinel
+            while True:
+                try:
+                    self.frame_queue.get_nowait()
+                except queue.Empty:
+                    break
+            self.frame_queue.put(None)
+            self._worker.join()
+            self._worker = None
         if self.out:
             self.out.release()
             logging.debug("GStreamer pipeline released.")
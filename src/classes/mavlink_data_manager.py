@@ -1,6 +1,5 @@
 from collections import deque
 import threading
-import time
 from numpy import uint16
 import requests
 import logging
@@ -9,7 +8,7 @@ from .parameters import Parameters
 import math
 
 class MavlinkDataManager:
-    def __init__(self, mavlink_host, mavlink_port, polling_interval, data_points, enabled=True):
+    def __init__(self, mavlink_host, mavlink_port, polling_interval, data_points, enabled=True, executor=None):
         """
         Initialize the MavlinkDataManager with necessary parameters.
 
@@ -19,15 +18,22 @@ class MavlinkDataManager:
             polling_interval (int): The interval at which data should be polled in seconds.
             data_points (dict): A dictionary of data points to extract from MAVLink.
             enabled (bool): Whether the polling should be enabled or not.
+            executor (concurrent.futures.Executor, optional): Executor for the async fetchers.
+                Defaults to the event loop's default executor.
         """
         self.mavlink_host = mavlink_host
         self.mavlink_port = mavlink_port
         self.polling_interval = polling_interval
         self.data_points = data_points  # Dictionary of data points to extract
         self.enabled = enabled
+        self.executor = executor
         self.data = {}  # Stores the fetched data
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
+        # Keep-alive HTTP sessions: one for the poller thread, one per executor thread for the
+        # async fetchers, since requests.Session is not guaranteed to be thread-safe
+        self._session = requests.Session()
+        self._thread_sessions = threading.local()
         self.velocity_buffer = deque(maxlen=10)  # Buffer for velocity smoothing
         self.min_velocity_threshold = 0.5  # m/s, adjust based on your drone's characteristics
         self.gamma = 0
@@ -62,7 +68,7 @@ class MavlinkDataManager:
         """
         while not self._stop_event.is_set():
             self._fetch_and_parse_all_data()
-            time.sleep(self.polling_interval)
+            self._stop_event.wait(self.polling_interval)
 
     def _fetch_and_parse_all_data(self):
         """
@@ -70,7 +76,7 @@ class MavlinkDataManager:
         """
         try:
             url = f"http://{self.mavlink_host}:{self.mavlink_port}/v1/mavlink"
-            response = requests.get(url)
+            response = self._session.get(url)
             response.raise_for_status()
             json_data = response.json()
 
@@ -109,7 +115,7 @@ class MavlinkDataManager:
         vd = self.data.get("vd", 0.0)
 
         # Calculate total velocity
-        v_total = math.sqrt(vn**2 + ve**2 + vd**2)
+        v_total = math.hypot(vn, ve, vd)
 
         # Add to buffer for smoothing
         self.velocity_buffer.append((vn, ve, vd))
@@ -120,7 +126,7 @@ class MavlinkDataManager:
         avg_vd = sum(v[2] for v in self.velocity_buffer) / len(self.velocity_buffer)
 
         # Calculate horizontal speed using averaged values
-        v_horizontal = math.sqrt(avg_vn**2 + avg_ve**2)
+        v_horizontal = math.hypot(avg_vn, avg_ve)
 
         # Check if the total velocity is above the threshold
         if v_total < self.min_velocity_threshold:
@@ -188,6 +194,21 @@ class MavlinkDataManager:
                 return None  # Avoid unnecessary logging and simply return None
             return self.data.get(point, 0)
 
+    def _get_with_thread_session(self, url):
+        """
+        Performs a GET with the calling thread's own keep-alive session, creating it on first use.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            requests.Response: The response.
+        """
+        session = getattr(self._thread_sessions, 'session', None)
+        if session is None:
+            session = self._thread_sessions.session = requests.Session()
+        return session.get(url)
+
     async def fetch_data_from_uri(self, uri):
         """
         Fetch data from a specific URI and return the parsed JSON response.
@@ -200,7 +221,9 @@ class MavlinkDataManager:
         """
         url = f"http://{self.mavlink_host}:{self.mavlink_port}{uri}"
         try:
-            response = requests.get(url)
+            # Run the blocking request in an executor so the event loop is not stalled
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(self.executor, self._get_with_thread_session, url)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -277,7 +300,7 @@ class MavlinkDataManager:
             try:
                 vx = float(message.get("vx", 0))
                 vy = float(message.get("vy", 0))
-                ground_speed = float(math.sqrt(vx**2+vy**2))
+                ground_speed = math.hypot(vx, vy)
             except (ValueError, TypeError):
                 self.logger.warning("Invalid ground speed data received, falling back to 0.")
                 ground_speed = 0.0
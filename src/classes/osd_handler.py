@@ -5,6 +5,9 @@ import numpy as np
 from .parameters import Parameters
 
 class OSDHandler:
+    # OSD elements whose pixels never change between frames of the same size
+    STATIC_ELEMENTS = ("name", "crosshair", "attitude_indicator")
+
     def __init__(self, app_controller=None):
         """
         Initialize the OSDHandler with a reference to AppController.
@@ -14,28 +17,80 @@ class OSDHandler:
         self.osd_config = Parameters.OSD_CONFIG
         self.logger = logging.getLogger(__name__)
 
+        # Prerendered static layer, rebuilt whenever the frame shape changes
+        self._template_shape = None
+        self._static_regions = {}
+
     def draw_osd(self, frame):
         """
         Draw all enabled OSD elements on the frame.
+        Static elements are composited from a prerendered template at their configured
+        position in the drawing order, so layering is the same as drawing them directly.
         """
+        if frame.shape != self._template_shape:
+            self._build_static_template(frame.shape)
+
         for element_name, config in self.osd_config.items():
             if config["enabled"]:
                 if element_name == "name":
-                    self._draw_name(frame, config)
+                    self._blit_static(frame, element_name)
                 elif element_name == "datetime":
                     self._draw_datetime(frame, config)
                 elif element_name == "crosshair":
-                    self._draw_crosshair(frame, config)
+                    self._blit_static(frame, element_name)
                 elif element_name == "mavlink_data" and Parameters.MAVLINK_ENABLED:
                     self._draw_mavlink_data(frame, config)
                 elif element_name == "attitude_indicator":
                     self._draw_attitude_indicator(frame, config)
+                    self._blit_static(frame, element_name)  # Roll scale goes over the horizon and ladder
                 elif element_name == "tracker_status":
                     self._draw_tracker_status(frame, config)
                 elif element_name == "follower_status":
                     self._draw_follower_status(frame, config)
         return frame
 
+    def _build_static_template(self, shape):
+        """
+        Render the static OSD elements once for the given frame shape and keep
+        only the bounding region of each, together with its pixel mask.
+        """
+        self._template_shape = shape
+        self._static_regions = {}
+        static_drawers = {
+            "name": self._draw_name,
+            "crosshair": self._draw_crosshair,
+            "attitude_indicator": self._draw_attitude_scale,
+        }
+        for element_name in self.STATIC_ELEMENTS:
+            config = self.osd_config.get(element_name)
+            if not config or not config["enabled"]:
+                continue
+            # Render on black and on white so pixels of any colour are detected
+            layer = np.zeros(shape, dtype=np.uint8)
+            probe = np.full(shape, 255, dtype=np.uint8)
+            static_drawers[element_name](layer, config)
+            static_drawers[element_name](probe, config)
+            coverage = (layer != 0) | (probe != 255)
+            if coverage.ndim == 3:
+                coverage = coverage.any(axis=2)
+            x, y, w, h = cv2.boundingRect(coverage.astype(np.uint8))
+            if w == 0 or h == 0:
+                continue
+            mask = coverage[y:y + h, x:x + w]
+            if layer.ndim == 3:
+                mask = mask[:, :, np.newaxis]
+            self._static_regions[element_name] = (y, y + h, x, x + w, layer[y:y + h, x:x + w].copy(), mask.copy())
+        self.logger.debug(f"OSD static template built for frame shape {shape}.")
+
+    def _blit_static(self, frame, element_name):
+        """
+        Copy the prerendered pixels of a static element onto the frame.
+        """
+        region = self._static_regions.get(element_name)
+        if region is not None:
+            y0, y1, x0, x1, layer, mask = region
+            np.copyto(frame[y0:y1, x0:x1], layer, where=mask)
+
     def _draw_tracker_status(self, frame, config):
         """
         Draw the tracker status on the frame.
@@ -212,6 +267,13 @@ class OSDHandler:
 
             cv2.line(frame, tick_pt1, tick_pt2, config["grid_color"], config["thickness"])
 
+    def _draw_attitude_scale(self, frame, config):
+        """
+        Draw the static part of the attitude indicator (roll scale semi-circle).
+        """
+        center_x, center_y = self._convert_position(frame, config["position"])
+        size_x, size_y = config["size"]
+
         # Draw roll indicator (semi-circle at the top of the screen)
         cv2.ellipse(
             frame,
@@ -97,16 +97,18 @@ class PX4InterfaceManager:
         Default values are set to zero in case of data loss or missing data.
         """
         try:
-            # Fetch attitude data (roll, pitch, yaw)
-            attitude_data = await self.mavlink_data_manager.fetch_attitude_data()
+            # Fetch attitude, altitude and ground speed concurrently
+            attitude_data, altitude_data, ground_speed = await asyncio.gather(
+                self.mavlink_data_manager.fetch_attitude_data(),
+                self.mavlink_data_manager.fetch_altitude_data(),
+                self.mavlink_data_manager.fetch_ground_speed(),
+            )
             self.current_roll = attitude_data.get("roll", 0.0)
             self.current_pitch = attitude_data.get("pitch", 0.0)
             self.current_yaw = attitude_data.get("yaw", 0.0)
-            
-            # Fetch altitude data
-            altitude_data = await self.mavlink_data_manager.fetch_altitude_data()
+
             self.current_altitude = altitude_data.get("altitude_relative", 0.0)  # Or use "altitude_amsl" if required
-            self.current_ground_speed = await self.mavlink_data_manager.fetch_ground_speed()
+            self.current_ground_speed = ground_speed
 
         except Exception as e:
             logger.error(f"Error updating telemetry via MAVLink2Rest: {e}")
@@ -215,8 +217,10 @@ class PX4InterfaceManager:
         """
         Converts local frame velocities to NED frame using the current yaw.
         """
-        ned_vel_x = vel_x * math.cos(yaw) - vel_y * math.sin(yaw)
-        ned_vel_y = vel_x * math.sin(yaw) + vel_y * math.cos(yaw)
+        cos_yaw = math.cos(yaw)
+        sin_yaw = math.sin(yaw)
+        ned_vel_x = vel_x * cos_yaw - vel_y * sin_yaw
+        ned_vel_y = vel_x * sin_yaw + vel_y * cos_yaw
         return ned_vel_x, ned_vel_y
 
     async def start_offboard_mode(self):
@@ -0,0 +1,59 @@
+# src/classes/ring_buffer.py
+
+import numpy as np
+
+class RingBuffer:
+    """
+    Fixed-capacity history of fixed-width samples (e.g. (x, y) centers) stored in a
+    contiguous NumPy array with a write index.
+
+    It is a drop-in replacement for `deque(maxlen=N)` where only `append`, `clear` and
+    `len` are needed, and lets consumers process the whole history with vectorized
+    NumPy operations instead of iterating over Python tuples.
+    """
+
+    def __init__(self, capacity: int, width: int = 2, dtype=np.float32):
+        """
+        Initializes the buffer.
+
+        Args:
+            capacity (int): Maximum number of samples kept; older samples are overwritten.
+            width (int): Number of values per sample.
+            dtype (np.dtype): Data type of the stored values.
+        """
+        self.capacity = max(int(capacity), 1)
+        self._data = np.zeros((self.capacity, width), dtype=dtype)
+        self._head = 0      # Index of the next write
+        self._count = 0     # Number of valid samples
+
+    def append(self, sample) -> None:
+        """
+        Stores a sample, overwriting the oldest one when the buffer is full.
+
+        Args:
+            sample (sequence): The values of the sample, of length `width`.
+        """
+        self._data[self._head] = sample
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self) -> None:
+        """Discards all samples."""
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def array(self) -> np.ndarray:
+        """
+        Returns the stored samples in chronological order (oldest first).
+
+        Returns:
+            np.ndarray: A (len, width) array. It is a view when the buffer has not
+            wrapped around yet, otherwise a copy.
+        """
+        if self._count < self.capacity:
+            return self._data[:self._count]
+        return np.concatenate((self._data[self._head:], self._data[:self._head]))
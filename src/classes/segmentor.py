@@ -15,6 +15,7 @@ class Segmentor:
         if 'yolov8' in self.algorithm:
             self.model = YOLO(f"{self.algorithm}.pt")
         self.previous_detections = []
+        self._boxes_np = None  # (N, 4) array mirroring previous_detections
 
     def segment_frame(self, frame):
         """
@@ -35,8 +36,8 @@ class Segmentor:
             current_detections = self.extract_detections(results)
             filtered_detections = self.manage_detections(current_detections)
             return annotated_frame
-        except Exception as e:
-            logger.error(f"Error during YOLOv8 segmentation: {e}")
+        except Exception:
+            logger.exception("Error during YOLOv8 segmentation")
             return frame
 
     def generic_segmentation(self, frame):
@@ -49,23 +50,24 @@ class Segmentor:
     def extract_detections(self, results):
         """
         Extracts bounding box detections from YOLOv8 results.
+
+        Raises:
+            ValueError: If the boxes are not an (N, 4+) array.
         """
-        try:
-            detections = []
-            for det in results[0].boxes.xyxy.tolist():
-                assert isinstance(det, (list, tuple)) and len(det) >= 4, "Detection format error"
-                detections.append(det[:4])
-            return detections
-        except Exception as e:
-            logger.error(f"Error extracting detections: {e}")
-            return []
+        xyxy = results[0].boxes.xyxy
+        if hasattr(xyxy, "cpu"):  # torch tensor; some ultralytics/CPU paths already give a numpy array
+            xyxy = xyxy.cpu()
+        boxes = np.asarray(xyxy)
+        if boxes.ndim != 2 or boxes.shape[1] < 4:
+            raise ValueError(f"Detection format error: expected an (N, 4) box array, got shape {boxes.shape}")
+        return boxes[:, :4].tolist()
 
     def manage_detections(self, current_detections):
         """
         Filters out duplicate detections based on IoU and temporal stability.
         """
         if not self.previous_detections:
-            self.previous_detections = current_detections
+            self._set_previous_detections(current_detections)
             return current_detections
         
         filtered_detections = []
@@ -73,9 +75,16 @@ class Segmentor:
             if not any(self.iou(current, prev) > 0.5 for prev in self.previous_detections):
                 filtered_detections.append(current)
         
-        self.previous_detections = current_detections
+        self._set_previous_detections(current_detections)
         return filtered_detections
 
+    def _set_previous_detections(self, detections):
+        """
+        Stores the detections and refreshes their stacked (N, 4) array form.
+        """
+        self.previous_detections = detections
+        self._boxes_np = np.asarray(detections, dtype=np.float64).reshape(-1, 4)
+
     def iou(self, boxA, boxB):
         """
         Calculates the Intersection over Union (IoU) of two bounding boxes.
@@ -102,6 +111,12 @@ class Segmentor:
         """
         return self.previous_detections
 
+    def get_last_detections_array(self):
+        """
+        Returns the last detections as an (N, 4) array of (x1, y1, x2, y2), or None if not yet computed.
+        """
+        return self._boxes_np
+
     def user_click_coordinates(self, frame):
         """
         Captures the coordinates of a user click on the frame.
@@ -137,12 +152,7 @@ class Segmentor:
 
             binMask = np.where((mask == 2) | (mask == 0), 0, 1).astype('uint8')
 
-            contours, _ = cv2.findContours(binMask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            if contours:
-                c = max(contours, key=cv2.contourArea)
-                x, y, w, h = cv2.boundingRect(c)
-                return (x, y, w, h)
-            return None
+            return self._largest_component_bbox(binMask)
         except Exception as e:
             logger.error(f"Error during GrabCut segmentation: {e}")
             return None
@@ -159,14 +169,22 @@ class Segmentor:
             rect = (x, y, w, h)
             cv2.grabCut(frame, mask, rect, bgdModel, fgdModel, 5, cv2.GC_INIT_WITH_RECT)
             mask2 = np.where((mask == 2) | (mask == 0), 0, 1).astype('uint8')
-            frame_cut = frame * mask2[:, :, np.newaxis]
 
-            contours, _ = cv2.findContours(mask2, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            if contours:
-                c = max(contours, key=cv2.contourArea)
-                x, y, w, h = cv2.boundingRect(c)
-                return (x, y, w, h)
-            return bbox
+            refined = self._largest_component_bbox(mask2)
+            return refined if refined is not None else bbox
         except Exception as e:
             logger.error(f"Error refining bounding box: {e}")
             return bbox
+
+    def _largest_component_bbox(self, bin_mask):
+        """
+        Returns the (x, y, w, h) box of the largest foreground blob in a binary mask,
+        or None if the mask is empty. Uses a single connected-components pass.
+        """
+        n, _, stats, _ = cv2.connectedComponentsWithStats(bin_mask, connectivity=8, ltype=cv2.CV_32S)
+        if n <= 1:
+            return None
+        # Row 0 is the background component
+        largest = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+        x, y, w, h = stats[largest, :4]
+        return (int(x), int(y), int(w), int(h))
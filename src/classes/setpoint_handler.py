@@ -79,6 +79,27 @@ class SetpointHandler:
         else:
             raise ValueError(f"Field '{field_name}' is not valid for profile '{self.profile_name}'. Valid fields: {list(self.fields.keys())}")
 
+    def set_fields(self, values: Dict[str, float]):
+        """
+        Sets several fields of the setpoint at once, validating the field names in a single pass.
+        Intended for followers that produce all their commands in the same control tick.
+
+        Args:
+            values (dict): Mapping of field names to numeric values.
+
+        Raises:
+            ValueError: If a field name is not valid for the current profile or if a value is not numeric.
+        """
+        invalid = values.keys() - self.fields.keys()
+        if invalid:
+            raise ValueError(f"Fields {sorted(invalid)} are not valid for profile '{self.profile_name}'. Valid fields: {list(self.fields.keys())}")
+        try:
+            converted = {field_name: float(value) for field_name, value in values.items()}
+        except (TypeError, ValueError):
+            raise ValueError(f"The values for {list(values.keys())} must be numeric types (int or float).")
+        self.fields.update(converted)
+        logger.debug(f"Setpoints updated: {converted}")
+
     def get_fields(self) -> Dict[str, float]:
         """
         Returns the current fields of the setpoint.
@@ -2,7 +2,8 @@
 import logging
 import socket
 import json
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from classes.parameters import Parameters
 
 class TelemetryHandler:
@@ -24,7 +25,12 @@ class TelemetryHandler:
         self.server_address = (self.host, self.port)
         self.send_interval = 1.0 / self.send_rate  # Convert rate to interval in seconds
 
-        self.last_sent_time = datetime.utcnow()
+        # Preallocated ring of pending samples; flushed as a single datagram when full
+        self.batch_size = max(int(getattr(Parameters, "TELEMETRY_BATCH_SIZE", 1)), 1)  # Optional key; older configs lack it
+        self._batch = [None] * self.batch_size
+        self._batch_index = 0
+
+        self.last_sent_time = time.monotonic()  # Monotonic clock: cheap, and immune to wall-clock jumps
         self.app_controller = app_controller
         self.tracker = self.app_controller.tracker
         self.follower = self.app_controller.follower
@@ -39,8 +45,7 @@ class TelemetryHandler:
         Returns:
             bool: True if the telemetry data should be sent, False otherwise.
         """
-        current_time = datetime.utcnow()
-        return (current_time - self.last_sent_time).total_seconds() >= self.send_interval
+        return time.monotonic() - self.last_sent_time >= self.send_interval
 
     def get_tracker_data(self):
         """
@@ -72,15 +77,18 @@ class TelemetryHandler:
             return telemetry
         return {}
 
-    def gather_telemetry_data(self):
+    def gather_telemetry_data(self, tracker_data=None):
         """
         Gather telemetry data from all enabled sources.
+
+        Args:
+            tracker_data (dict, optional): An already gathered tracker snapshot to reuse.
         
         Returns:
             dict: A dictionary containing telemetry data from all sources.
         """
         data = {
-            'tracker_data': self.get_tracker_data(),
+            'tracker_data': tracker_data if tracker_data is not None else self.get_tracker_data(),
             'follower_data': self.get_follower_data(),
         }
         return data
@@ -89,18 +97,40 @@ class TelemetryHandler:
         """
         Send the telemetry data via UDP if conditions are met and update the latest telemetry data.
         """
+        # Gather each source once; the same snapshot feeds UDP and the API
+        tracker_data = self.get_tracker_data()
         if self.should_send_telemetry() and self.enable_udp:
-            data = self.gather_telemetry_data()
-            message = json.dumps(data)
-            self.udp_socket.sendto(message.encode('utf-8'), self.server_address)
-            self.last_sent_time = datetime.utcnow()
-            logging.debug(f"Telemetry sent: {data}")
-        
-        # Update the latest telemetry data regardless of UDP sending
-        self.latest_tracker_data = self.get_tracker_data()
-        if Parameters.ENABLE_FOLLOWER_TELEMETRY:
+            data = self.gather_telemetry_data(tracker_data)
+            self._queue_udp(data)
+            self.last_sent_time = time.monotonic()
+            if Parameters.ENABLE_FOLLOWER_TELEMETRY:
+                self.latest_follower_data = data['follower_data']
+        elif Parameters.ENABLE_FOLLOWER_TELEMETRY:
             self.latest_follower_data = self.get_follower_data()
+
+        # Update the latest telemetry data regardless of UDP sending
+        self.latest_tracker_data = tracker_data
         # logging.debug(f"Latest tracker data: {self.latest_tracker_data}")
         # logging.debug(f"Latest follower data: {self.latest_follower_data}")
 
+    def _queue_udp(self, data):
+        """
+        Add a telemetry sample to the batch ring and send the batch in one datagram once it is full.
+        With a batch size of 1 each sample is sent on its own, as a plain JSON object.
+
+        Args:
+            data (dict): The telemetry sample to send.
+        """
+        if self.batch_size == 1:
+            payload = data
+        else:
+            self._batch[self._batch_index] = data
+            self._batch_index += 1
+            if self._batch_index < self.batch_size:
+                return
+            payload = self._batch
+            self._batch_index = 0
 
+        message = json.dumps(payload)
+        self.udp_socket.sendto(message.encode('utf-8'), self.server_address)
+        logging.debug(f"Telemetry sent: {payload}")
@@ -23,7 +23,7 @@ In the context of aerial target tracking, having a unified tracker interface ens
 
 Key Features:
 -------------
-- **Abstract Methods**: Enforces implementation of essential methods like `start_tracking` and `update`.
+- **Required Methods**: `start_tracking` and `update` raise `NotImplementedError` unless overridden.
 - **Common Attributes**: Manages shared properties such as bounding boxes, centers, and normalization.
 - **Estimator Integration**: Supports integration with estimators (e.g., Kalman Filter) to enhance tracking robustness.
 - **Visualization Tools**: Provides methods for drawing tracking information on video frames.
@@ -77,18 +77,18 @@ References:
 
 """
 
-from abc import ABC, abstractmethod
 from collections import deque
 import time
 import numpy as np
 from typing import Optional, Tuple
 import cv2
 from classes.parameters import Parameters
+from classes.ring_buffer import RingBuffer
 import logging
 
-class BaseTracker(ABC):
+class BaseTracker:
     """
-    Abstract Base Class for Object Trackers
+    Base Class for Object Trackers
 
     Defines the interface and common functionalities for different tracking algorithms used in the system.
 
@@ -102,18 +102,18 @@ class BaseTracker(ABC):
     - center (Optional[Tuple[int, int]]): Current center of the bounding box.
     - normalized_bbox (Optional[Tuple[float, float, float, float]]): Normalized bounding box.
     - normalized_center (Optional[Tuple[float, float]]): Normalized center coordinates.
-    - center_history (deque): History of center positions.
+    - center_history (RingBuffer): History of center positions as a contiguous (N, 2) array.
     - estimator_enabled (bool): Indicates if the estimator is enabled.
     - position_estimator (Optional[BaseEstimator]): Estimator instance for position estimation.
-    - estimated_position_history (deque): History of estimated positions.
+    - estimated_position_history (Optional[deque]): History of estimated positions (None without an estimator).
     - last_update_time (float): Timestamp of the last update.
     - frame (Optional[np.ndarray]): Placeholder for the current video frame.
     - confidence (float): Confidence score of the tracker.
 
     Methods:
     --------
-    - start_tracking(frame, bbox): Abstract method to start tracking with an initial frame and bounding box.
-    - update(frame): Abstract method to update the tracker with a new frame.
+    - start_tracking(frame, bbox): Must be overridden; starts tracking with an initial frame and bounding box.
+    - update(frame): Must be overridden; updates the tracker with a new frame.
     - compute_confidence(frame): Computes the confidence score based on motion and appearance consistency.
     - get_confidence(): Returns the current confidence score.
     - is_motion_consistent(): Checks if the motion is consistent based on displacement thresholds.
@@ -121,14 +121,20 @@ class BaseTracker(ABC):
     - normalize_center_coordinates(): Normalizes the center coordinates relative to the frame size.
     - print_normalized_center(): Logs the normalized center coordinates.
     - set_center(value): Sets the center coordinates and normalizes them.
+    - set_bbox(value): Sets the bounding box as a tuple of plain ints.
     - normalize_bbox(): Normalizes the bounding box coordinates relative to the frame size.
     - reinitialize_tracker(frame, bbox): Reinitializes the tracker with a new bounding box.
     - draw_tracking(frame, tracking_successful): Draws tracking bounding box and center on the frame.
+    - draw_overlay(frame, tracking_successful, draw_estimate): Draws tracking and estimate overlays in one call.
     - draw_normal_bbox(frame, tracking_successful): Draws a standard rectangle bounding box.
     - draw_fancy_bbox(frame, tracking_successful): Draws a stylized bounding box with additional visuals.
     - draw_estimate(frame, tracking_successful): Draws the estimated position from the estimator.
     """
 
+    # Anchor point (index into the overlay points: center, top-left, bottom-right, bottom-left, top-right)
+    # for the start and end of each crosshair/corner segment of the fancy bbox
+    _SEGMENT_ANCHORS = np.array([[0, 0], [0, 0], [1, 1], [1, 1], [2, 2], [2, 2], [3, 3], [3, 3], [4, 4], [4, 4]])
+
     def __init__(self, video_handler: Optional[object] = None, detector: Optional[object] = None, app_controller: Optional[object] = None):
         """
         Initializes the base tracker with common attributes.
@@ -148,12 +154,18 @@ class BaseTracker(ABC):
         self.center: Optional[Tuple[int, int]] = None          # Current center
         self.normalized_bbox: Optional[Tuple[float, float, float, float]] = None  # Normalized bounding box
         self.normalized_center: Optional[Tuple[float, float]] = None              # Normalized center
-        self.center_history = deque(maxlen=Parameters.CENTER_HISTORY_LENGTH)      # History of centers
+        self.center_history = RingBuffer(Parameters.CENTER_HISTORY_LENGTH)          # History of centers
+
+        # Reciprocal frame dimensions for normalization, refreshed when the frame size changes
+        self._scale_size: Optional[Tuple[int, int]] = None
+        self._inv_w = self._inv_h = self._inv_half_w = self._inv_half_h = 0.0
 
         # Estimator initialization
         self.estimator_enabled = Parameters.USE_ESTIMATOR
         self.position_estimator = self.app_controller.estimator if self.estimator_enabled else None
-        self.estimated_position_history = deque(maxlen=Parameters.ESTIMATOR_HISTORY_LENGTH)
+        # Only allocated when there is an estimator to feed it; every append is guarded by position_estimator
+        self.estimated_position_history = (deque(maxlen=Parameters.ESTIMATOR_HISTORY_LENGTH)
+                                           if self.position_estimator else None)
         self.last_update_time: float = 1e-6
 
         # Confidence score
@@ -166,21 +178,27 @@ class BaseTracker(ABC):
         self.override_bbox: Optional[Tuple[int, int, int, int]] = None
         self.override_center: Optional[Tuple[int, int]] = None
 
-    @abstractmethod
+        # Reusable buffers for the fancy bbox overlay, so drawing does not rebuild point tuples every frame
+        self._overlay_points = np.zeros((5, 2), dtype=np.int32)
+        self._overlay_segments = np.zeros((len(self._SEGMENT_ANCHORS), 2, 2), dtype=np.int32)
+        self._overlay_extended = np.zeros((4, 2, 2), dtype=np.int32)
+        self._overlay_offsets = self._build_overlay_offsets()
+
     def start_tracking(self, frame: np.ndarray, bbox: Tuple[int, int, int, int]) -> None:
         """
-        Abstract method to start tracking with the given frame and bounding box.
+        Starts tracking with the given frame and bounding box.
+        Implementations also initialize the detector's appearance model here when
+        `self.detector` is not None, so callers never touch the detector directly.
 
         Args:
             frame (np.ndarray): The initial video frame to start tracking.
             bbox (Tuple[int, int, int, int]): A tuple representing the bounding box (x, y, width, height).
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def update(self, frame: np.ndarray) -> Tuple[bool, Tuple[int, int, int, int]]:
         """
-        Abstract method to update the tracker with the new frame.
+        Updates the tracker with the new frame.
 
         Args:
             frame (np.ndarray): The current video frame.
@@ -188,7 +206,7 @@ class BaseTracker(ABC):
         Returns:
             Tuple[bool, Tuple[int, int, int, int]]: A tuple containing the success status and the new bounding box.
         """
-        pass
+        raise NotImplementedError
 
     def compute_confidence(self, frame: np.ndarray) -> float:
         """
@@ -271,11 +289,25 @@ class BaseTracker(ABC):
         the top-right is (1, 1), and the bottom-left is (-1, -1).
         """
         if self.center:
-            frame_width, frame_height = self.video_handler.width, self.video_handler.height
-            normalized_x = (self.center[0] - frame_width / 2) / (frame_width / 2)
-            normalized_y = (self.center[1] - frame_height / 2) / (frame_height / 2)
+            self._ensure_frame_scale()
+            normalized_x = self.center[0] * self._inv_half_w - 1.0
+            normalized_y = self.center[1] * self._inv_half_h - 1.0
             self.normalized_center = (normalized_x, normalized_y)
 
+    def _ensure_frame_scale(self) -> None:
+        """
+        Caches the reciprocal frame width/height (and half width/height) used by the
+        normalization helpers, so each normalization is a multiply instead of a division.
+        """
+        size = (self.video_handler.width, self.video_handler.height)
+        if size != self._scale_size:
+            frame_width, frame_height = size
+            self._inv_w = 1.0 / frame_width
+            self._inv_h = 1.0 / frame_height
+            self._inv_half_w = 2.0 / frame_width
+            self._inv_half_h = 2.0 / frame_height
+            self._scale_size = size
+
     def print_normalized_center(self) -> None:
         """
         Logs the normalized center coordinates of the tracked target.
@@ -296,7 +328,20 @@ class BaseTracker(ABC):
             value (Tuple[int, int]): The (x, y) coordinates of the center.
         """
         self.center = value
-        self.normalize_center_coordinates()  # Automatically normalize when center is updated
+        # Normalize inline (same transform as normalize_center_coordinates); runs on every tracker update
+        self._ensure_frame_scale()
+        self.normalized_center = (value[0] * self._inv_half_w - 1.0, value[1] * self._inv_half_h - 1.0)
+
+    def set_bbox(self, value: Tuple[int, int, int, int]) -> None:
+        """
+        Sets the bounding box, converting its components to plain ints once so that
+        drawing and normalization never need to cast them again.
+
+        Args:
+            value (Tuple[int, int, int, int]): The bounding box (x, y, width, height).
+        """
+        x, y, w, h = value
+        self.bbox = (int(x), int(y), int(w), int(h))
 
     def normalize_bbox(self) -> None:
         """
@@ -305,12 +350,12 @@ class BaseTracker(ABC):
         This is useful for consistent representation and for control inputs that require normalized values.
         """
         if self.bbox and self.video_handler:
-            frame_width, frame_height = self.video_handler.width, self.video_handler.height
+            self._ensure_frame_scale()
             x, y, w, h = self.bbox
-            norm_x = (x - frame_width / 2) / (frame_width / 2)
-            norm_y = (y - frame_height / 2) / (frame_height / 2)
-            norm_w = w / frame_width
-            norm_h = h / frame_height
+            norm_x = x * self._inv_half_w - 1.0
+            norm_y = y * self._inv_half_h - 1.0
+            norm_w = w * self._inv_w
+            norm_h = h * self._inv_h
             self.normalized_bbox = (norm_x, norm_y, norm_w, norm_h)
             # logging.debug(f"Normalized bbox: {self.normalized_bbox}")
 
@@ -338,21 +383,69 @@ class BaseTracker(ABC):
         Returns:
             np.ndarray: The frame with tracking drawn.
         """
-        if self.bbox and self.center and self.video_handler:
-            if Parameters.TRACKED_BBOX_STYLE == 'fancy':
-                self.draw_fancy_bbox(frame, tracking_successful)
-            else:
-                self.draw_normal_bbox(frame, tracking_successful)
+        if not getattr(Parameters, 'ENABLE_OVERLAY', True):
+            return frame
+        dot = self._draw_tracking_bbox(frame, tracking_successful)
+        if dot is not None:
+            cv2.circle(frame, dot[0], 5, dot[1], -1)
+        return frame
 
-            # Draw center dot
-            cv2.circle(frame, self.center, 5, (0, 255, 0), -1)
+    def draw_overlay(self, frame: np.ndarray, tracking_successful: bool = True, draw_estimate: bool = True) -> np.ndarray:
+        """
+        Draws the tracking overlay and, optionally, the estimated position in a single pass.
+        The center and estimate dots are collected and drawn together after the bounding box.
 
-            # Optionally display deviations
-            if Parameters.DISPLAY_DEVIATIONS:
-                self.print_normalized_center()
+        Args:
+            frame (np.ndarray): The video frame.
+            tracking_successful (bool): Whether the tracking was successful.
+            draw_estimate (bool): Whether to also draw the estimator output.
 
+        Returns:
+            np.ndarray: The frame with the overlay drawn.
+        """
+        if not getattr(Parameters, 'ENABLE_OVERLAY', True):
+            return frame
+        dots = [self._draw_tracking_bbox(frame, tracking_successful)]
+        if draw_estimate:
+            dots.append(self._estimate_dot(tracking_successful))
+        for dot in dots:
+            if dot is not None:
+                cv2.circle(frame, dot[0], 5, dot[1], -1)
         return frame
 
+    def _draw_tracking_bbox(self, frame: np.ndarray, tracking_successful: bool):
+        """
+        Draws the tracked bounding box in the configured style.
+
+        Returns:
+            tuple or None: The (center, color) of the center dot still to be drawn, or None if nothing is tracked.
+        """
+        if not (self.bbox and self.center and self.video_handler):
+            return None
+        if Parameters.TRACKED_BBOX_STYLE == 'fancy':
+            self.draw_fancy_bbox(frame, tracking_successful)
+        else:
+            self.draw_normal_bbox(frame, tracking_successful)
+
+        # Optionally display deviations
+        if Parameters.DISPLAY_DEVIATIONS:
+            self.print_normalized_center()
+        return self.center, (0, 255, 0)
+
+    def _estimate_dot(self, tracking_successful: bool):
+        """
+        Returns:
+            tuple or None: The (center, color) of the estimated position dot, or None if there is no estimate.
+        """
+        if not (self.estimator_enabled and self.position_estimator and self.video_handler):
+            return None
+        estimated_position = self.position_estimator.get_estimate()
+        if not estimated_position:
+            return None
+        estimated_x, estimated_y = estimated_position[:2]
+        color = Parameters.ESTIMATED_POSITION_COLOR if tracking_successful else Parameters.ESTIMATION_ONLY_COLOR
+        return (int(estimated_x), int(estimated_y)), color
+
     def draw_normal_bbox(self, frame: np.ndarray, tracking_successful: bool = True) -> None:
         """
         Draws a normal rectangle bounding box on the frame.
@@ -361,11 +454,35 @@ class BaseTracker(ABC):
             frame (np.ndarray): The video frame.
             tracking_successful (bool): Whether the tracking was successful.
         """
-        p1 = (int(self.bbox[0]), int(self.bbox[1]))
-        p2 = (int(self.bbox[0] + self.bbox[2]), int(self.bbox[1] + self.bbox[3]))
+        x, y, w, h = self.bbox
+        p1 = (x, y)
+        p2 = (x + w, y + h)
         color = (255, 0, 0) if tracking_successful else (0, 0, 255)
         cv2.rectangle(frame, p1, p2, color, 2)
 
+    @staticmethod
+    def _build_overlay_offsets() -> np.ndarray:
+        """
+        Builds the constant offsets of each crosshair/corner segment end from its anchor point.
+
+        Returns:
+            np.ndarray: A (10, 2, 2) int32 array matching `_SEGMENT_ANCHORS`.
+        """
+        arm = Parameters.CROSSHAIR_ARM_LENGTH
+        corner = Parameters.BBOX_CORNER_ARM_LENGTH
+        return np.array([
+            ((-arm, 0), (arm, 0)),          # Crosshair horizontal
+            ((0, -arm), (0, arm)),          # Crosshair vertical
+            ((0, 0), (corner, 0)),          # Top-left corner
+            ((0, 0), (0, corner)),
+            ((0, 0), (-corner, 0)),         # Bottom-right corner
+            ((0, 0), (0, -corner)),
+            ((0, 0), (corner, 0)),          # Bottom-left corner
+            ((0, 0), (0, -corner)),
+            ((0, 0), (-corner, 0)),         # Top-right corner
+            ((0, 0), (0, corner)),
+        ], dtype=np.int32)
+
     def draw_fancy_bbox(self, frame, tracking_successful: bool = True):
         """
         Draws a stylized bounding box with additional visuals, such as crosshairs and extended lines.
@@ -382,47 +499,34 @@ class BaseTracker(ABC):
                  if self.app_controller.following_active 
                  else Parameters.FOLLOWER_INACTIVE_COLOR)
 
-        p1 = (int(self.bbox[0]), int(self.bbox[1]))
-        p2 = (int(self.bbox[0] + self.bbox[2]), int(self.bbox[1] + self.bbox[3]))
-        center_x, center_y = self.center
-        
-        # Draw crosshair
-        cv2.line(frame, 
-                 (center_x - Parameters.CROSSHAIR_ARM_LENGTH, center_y), 
-                 (center_x + Parameters.CROSSHAIR_ARM_LENGTH, center_y), 
-                 color, 
-                 Parameters.BBOX_LINE_THICKNESS)
-        cv2.line(frame, 
-                 (center_x, center_y - Parameters.CROSSHAIR_ARM_LENGTH), 
-                 (center_x, center_y + Parameters.CROSSHAIR_ARM_LENGTH), 
-                 color, 
-                 Parameters.BBOX_LINE_THICKNESS)
-        
-        # Draw bounding box with corners
-        corner_points = [
-            (p1, (p1[0] + Parameters.BBOX_CORNER_ARM_LENGTH, p1[1])),
-            (p1, (p1[0], p1[1] + Parameters.BBOX_CORNER_ARM_LENGTH)),
-            (p2, (p2[0] - Parameters.BBOX_CORNER_ARM_LENGTH, p2[1])),
-            (p2, (p2[0], p2[1] - Parameters.BBOX_CORNER_ARM_LENGTH)),
-            ((p1[0], p2[1]), (p1[0] + Parameters.BBOX_CORNER_ARM_LENGTH, p2[1])),
-            ((p1[0], p2[1]), (p1[0], p2[1] - Parameters.BBOX_CORNER_ARM_LENGTH)),
-            ((p2[0], p1[1]), (p2[0] - Parameters.BBOX_CORNER_ARM_LENGTH, p1[1])),
-            ((p2[0], p1[1]), (p2[0], p1[1] + Parameters.BBOX_CORNER_ARM_LENGTH))
-        ]
-        
-        for start, end in corner_points:
-            cv2.line(frame, start, end, color, Parameters.BBOX_LINE_THICKNESS)
-
-        # Draw extended lines from the center of each edge of the bounding box
-        height, width, _ = frame.shape
-        cv2.line(frame, (p1[0], center_y), (0, center_y), color, Parameters.EXTENDED_LINE_THICKNESS)  # Left edge to left
-        cv2.line(frame, (p2[0], center_y), (width, center_y), color, Parameters.EXTENDED_LINE_THICKNESS)  # Right edge to right
-        cv2.line(frame, (center_x, p1[1]), (center_x, 0), color, Parameters.EXTENDED_LINE_THICKNESS)  # Top edge to top
-        cv2.line(frame, (center_x, p2[1]), (center_x, height), color, Parameters.EXTENDED_LINE_THICKNESS)  # Bottom edge to bottom
+        # Anchor points, written into the preallocated buffer: center, top-left, bottom-right, bottom-left, top-right
+        x, y, w, h = self.bbox
+        points = self._overlay_points
+        points[0] = self.center
+        points[1] = (x, y)
+        points[2] = (x + w, y + h)
+        points[3] = (x, y + h)
+        points[4] = (x + w, y)
+        (center_x, center_y), (x1, y1), (x2, y2) = points[:3].tolist()
+
+        # Crosshair and bounding box corners share colour and thickness: draw them in one call
+        segments = self._overlay_segments
+        np.take(points, self._SEGMENT_ANCHORS, axis=0, out=segments)
+        segments += self._overlay_offsets
+        cv2.polylines(frame, segments, False, color, Parameters.BBOX_LINE_THICKNESS)
+
+        # Draw extended lines from the center of each edge of the bounding box to the frame border
+        height, width = frame.shape[:2]
+        extended = self._overlay_extended
+        extended[0] = ((x1, center_y), (0, center_y))        # Left edge to left
+        extended[1] = ((x2, center_y), (width, center_y))    # Right edge to right
+        extended[2] = ((center_x, y1), (center_x, 0))        # Top edge to top
+        extended[3] = ((center_x, y2), (center_x, height))   # Bottom edge to bottom
+        cv2.polylines(frame, extended, False, color, Parameters.EXTENDED_LINE_THICKNESS)
 
         # Draw smaller dots at the corners of the bounding box
-        for point in [p1, p2, (p1[0], p2[1]), (p2[0], p1[1])]:
-            cv2.circle(frame, point, Parameters.CORNER_DOT_RADIUS, color, -1)
+        for point in points[1:].tolist():
+            cv2.circle(frame, tuple(point), Parameters.CORNER_DOT_RADIUS, color, -1)
 
         return frame
 
@@ -437,12 +541,11 @@ class BaseTracker(ABC):
         Returns:
             np.ndarray: The frame with the estimate drawn on it.
         """
-        if self.estimator_enabled and self.position_estimator and self.video_handler:
-            estimated_position = self.position_estimator.get_estimate()
-            if estimated_position:
-                estimated_x, estimated_y = estimated_position[:2]
-                color = Parameters.ESTIMATED_POSITION_COLOR if tracking_successful else Parameters.ESTIMATION_ONLY_COLOR
-                cv2.circle(frame, (int(estimated_x), int(estimated_y)), 5, color, -1)
+        if not getattr(Parameters, 'ENABLE_OVERLAY', True):
+            return frame
+        dot = self._estimate_dot(tracking_successful)
+        if dot is not None:
+            cv2.circle(frame, dot[0], 5, dot[1], -1)
         return frame
 
 
@@ -457,7 +560,7 @@ class BaseTracker(ABC):
             center (Tuple[int, int]): The (x, y) center of the selected target.
         """
         self.override_active = True
-        self.bbox = (bbox[0], bbox[1], bbox[2] - bbox[0], bbox[3] - bbox[1])  # Convert x1,y1,x2,y2 to x,y,w,h
+        self.set_bbox((bbox[0], bbox[1], bbox[2] - bbox[0], bbox[3] - bbox[1]))  # Convert x1,y1,x2,y2 to x,y,w,h
         self.set_center(center)
         self.center_history.append(center)
         self.normalize_bbox()
@@ -519,7 +622,8 @@ class BaseTracker(ABC):
         self.override_bbox = None
         self.override_center = None
         self.center_history.clear()
-        self.estimated_position_history.clear()
+        if self.estimated_position_history is not None:
+            self.estimated_position_history.clear()
         self.prev_center = None
         self.last_update_time = time.time()
         if self.position_estimator:
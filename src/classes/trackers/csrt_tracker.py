@@ -131,7 +131,7 @@ class CSRTTracker(BaseTracker):
                 self.prev_center = self.center
                 x1, y1, x2, y2 = smart_tracker.selected_bbox
                 w, h = x2 - x1, y2 - y1
-                self.bbox = (x1, y1, w, h)
+                self.set_bbox((x1, y1, w, h))
                 self.set_center(((x1 + x2) // 2, (y1 + y2) // 2))
                 self.normalize_bbox()
                 self.center_history.append(self.center)
@@ -155,8 +155,9 @@ class CSRTTracker(BaseTracker):
         
         if success:
             self.prev_center = self.center
-            self.bbox = detected_bbox
-            self.set_center((int(self.bbox[0] + self.bbox[2] / 2), int(self.bbox[1] + self.bbox[3] / 2)))
+            self.set_bbox(detected_bbox)
+            x, y, w, h = self.bbox
+            self.set_center((x + w // 2, y + h // 2))
             self.normalize_bbox()
             self.center_history.append(self.center)
 
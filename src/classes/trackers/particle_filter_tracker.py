@@ -127,7 +127,7 @@ class ParticleFilterTracker(BaseTracker):
         self.last_update_time = time.time()
 
         # Set initial bbox and center
-        self.bbox = bbox
+        self.set_bbox(bbox)
         self.set_center((int(center_x), int(center_y)))
         self.normalize_bbox()
         self.center_history.append(self.center)
@@ -167,7 +167,7 @@ class ParticleFilterTracker(BaseTracker):
         estimated_center = (int(estimated_state[0]), int(estimated_state[1]))
         self.prev_center = self.center
         self.set_center(estimated_center)
-        self.bbox = self.get_bbox_from_state(estimated_state)
+        self.set_bbox(self.get_bbox_from_state(estimated_state))
         self.normalize_bbox()
         self.center_history.append(self.center)
 
@@ -37,9 +37,10 @@ class VideoHandler:
         self.current_raw_frame = None
         self.current_osd_frame = None
 
-        # Resized versions for streaming
-        self.current_resized_raw_frame = None
-        self.current_resized_osd_frame = None
+        # Resized versions for streaming are produced lazily on first access
+        self._resize_target = None
+        self._resize_sources = (None, None)
+        self._resized_cache = {}
 
     def gstreamer_pipeline_csi(self, sensor_id=0, capture_width=1280, capture_height=720,
                                framerate=30, flip_method=0):
@@ -185,31 +186,54 @@ class VideoHandler:
 
     def update_resized_frames(self, width, height):
         """
-        Resizes the raw and OSD frames for streaming.
-        
+        Marks the current raw and OSD frames as the sources for streaming.
+
+        The actual resize is deferred until a consumer reads
+        `current_resized_raw_frame` or `current_resized_osd_frame`, so frames
+        nobody streams are never resized.
+
         Args:
             width (int): The target width.
             height (int): The target height.
         """
-        # Resize raw frame
-        if self.current_raw_frame is not None:
-            try:
-                self.current_resized_raw_frame = cv2.resize(self.current_raw_frame, (width, height))
-            except Exception as e:
-                logger.error(f"Error resizing raw frame: {e}")
-                self.current_resized_raw_frame = None
-        else:
-            self.current_resized_raw_frame = None
+        self._resize_target = (width, height)
+        self._resize_sources = (self.current_raw_frame, self.current_osd_frame)
+        self._resized_cache = {}
+
+    @property
+    def current_resized_raw_frame(self):
+        """Raw frame resized for streaming, or None if unavailable."""
+        return self._get_resized(0, "raw")
+
+    @property
+    def current_resized_osd_frame(self):
+        """OSD frame resized for streaming, or None if unavailable."""
+        return self._get_resized(1, "OSD")
 
-        # Resize OSD frame
-        if self.current_osd_frame is not None:
+    def _get_resized(self, index, label):
+        """
+        Resizes the selected source frame once per update and caches the result.
+
+        Args:
+            index (int): 0 for the raw frame, 1 for the OSD frame.
+            label (str): Name used in error messages.
+
+        Returns:
+            np.ndarray or None: The resized frame or None if unavailable.
+        """
+        # Bind locally so a concurrent update_resized_frames() cannot mix frames
+        cache = self._resized_cache
+        if index in cache:
+            return cache[index]
+        source = self._resize_sources[index]
+        resized = None
+        if source is not None and self._resize_target is not None:
             try:
-                self.current_resized_osd_frame = cv2.resize(self.current_osd_frame, (width, height))
+                resized = cv2.resize(source, self._resize_target)
             except Exception as e:
-                logger.error(f"Error resizing OSD frame: {e}")
-                self.current_resized_osd_frame = None
-        else:
-            self.current_resized_osd_frame = None
+                logger.error(f"Error resizing {label} frame: {e}")
+        cache[index] = resized
+        return resized
 
     def release(self):
         """
@@ -17,7 +17,8 @@ logger.setLevel(logging.INFO)
 
 class VideoStreamTrackCustom(VideoStreamTrack):
     """
-    A video stream track that pulls frames from the VideoHandler.
+    A video stream track that serves the latest frame captured by the VideoHandler.
+    It never reads from the capture source itself, so it does not steal frames from the main loop.
     """
 
     def __init__(self, video_handler, frame_rate=30):
@@ -41,7 +42,7 @@ class VideoStreamTrackCustom(VideoStreamTrack):
             if elapsed < self.frame_interval:
                 await asyncio.sleep(self.frame_interval - elapsed)
 
-            frame = self.video_handler.get_frame()
+            frame = self.video_handler.current_raw_frame
             if frame is not None:
                 # Validate frame format
                 if frame.dtype != 'uint8' or len(frame.shape) != 3 or frame.shape[2] != 3: